@@ -13,6 +13,10 @@ from scipy import stats
 @dataclass
 class MRRResult:
     """Results from Multi Random Retrieval evaluation"""
+    __slots__ = ('precision_at_k', 'recall_at_k', 'fix_accuracy', 'context_efficiency',
+                 'cross_file_hit_rate', 'debug_cycles', 'time_to_fix', 'regression_avoided',
+                 'confidence_interval')
+    
     precision_at_k: Dict[int, float]
     recall_at_k: Dict[int, float]
     fix_accuracy: float
@@ -22,6 +26,11 @@ class MRRResult:
     time_to_fix: float
     regression_avoided: float
     confidence_interval: float
+    
+    def __reduce__(self):
+        # Results are pickled back from benchmark worker processes; rebuilding
+        # from the field values is cheaper than the generic slots state protocol
+        return (MRRResult, tuple(getattr(self, name) for name in self.__slots__))
 
 class MRRMetrics:
     """
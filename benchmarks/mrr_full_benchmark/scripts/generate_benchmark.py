@@ -7,18 +7,74 @@ This creates realistic debugging scenarios with scattered context.
 import json
 import os
 import random
-import hashlib
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write data as 2-space indented JSON, using orjson when available"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+
+def _read_json(path: str) -> Any:
+    """Read a JSON file, using orjson when available"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path) as f:
+        return json.load(f)
+
+
+def _extract_summary_fields(path_str: str) -> Tuple[str, Optional[str]]:
+    """Read a bug file and return its (language, difficulty) pair"""
+    bug_data = _read_json(path_str)
+    return bug_data["language"], bug_data.get("difficulty")
 
 
 class BugGenerator:
     """Generate realistic bug scenarios for the MRR benchmark"""
     
+    # Repository size distribution per difficulty, as cumulative weights over REPO_SIZES
+    REPO_SIZES = ("small", "medium", "large", "enterprise")
+    REPO_SIZE_CUM_WEIGHTS = {
+        "easy": (2, 3, 3, 3),
+        "medium": (1, 3, 4, 4),
+        "hard": (0, 1, 3, 4)
+    }
+    # (files, loc) ranges per repository size
+    REPO_SIZE_RANGES = {
+        "small": ((50, 200), (5000, 10000)),
+        "medium": ((200, 1000), (10000, 100000)),
+        "large": ((1000, 5000), (100000, 1000000)),
+        "enterprise": ((5000, 20000), (1000000, 5000000))
+    }
+    CATEGORY_NAMES = ("syntax_errors", "logic_errors", "concurrency_issues",
+                      "memory_issues", "api_misuse", "performance_bugs", "cross_category")
+    # Function name parts; nouns are stored pre-capitalized for camelCase joining
+    FUNCTION_VERBS = ("get", "set", "process", "handle", "calculate", "validate", "update", "create")
+    FUNCTION_NOUNS = ("Data", "User", "Order", "Result", "Response", "Request", "Item", "Value")
+    
     def __init__(self, base_path: str):
         self.base_path = Path(base_path)
         self.bug_counter = 0
+        # Reference time shared by all generated dates; refreshed per generation run
+        self._now = datetime.now()
+        # Plain string category directories for the summary scan
+        self._category_dirs = {
+            category: os.path.join(str(self.base_path), category) for category in self.CATEGORY_NAMES
+        }
         
         # Templates for different bug types
         self.syntax_templates = self._load_syntax_templates()
@@ -31,6 +87,7 @@ class BugGenerator:
     def generate_all_bugs(self):
         """Generate all 5000 bug files"""
         print("Starting MRR Benchmark generation...")
+        self._now = datetime.now()
         
         # Generate each category
         categories = [
@@ -48,18 +105,19 @@ class BugGenerator:
             category_path = self.base_path / category_name
             category_path.mkdir(exist_ok=True)
             
+            # Build the whole category first, then write it out in one pass
+            bugs = []
             for i in range(count):
                 bug_id = f"mrr_{category_name}_{i+1:04d}"
-                bug_data = generator_func(bug_id, category_name)
-                
-                # Save bug file
-                file_path = category_path / f"{bug_id}.json"
-                with open(file_path, 'w') as f:
-                    json.dump(bug_data, f, indent=2)
+                bugs.append(generator_func(bug_id, category_name))
                 
                 if (i + 1) % 100 == 0:
                     print(f"  Generated {i + 1}/{count} {category_name}")
             
+            # Save bug files
+            for bug_data in bugs:
+                _write_json(category_path / f"{bug_data['bug_id']}.json", bug_data)
+            
             print(f"✓ Completed {category_name}")
         
         print("\n✓ Generated all 5000 bug files!")
@@ -666,26 +724,14 @@ class BugGenerator:
     
     def _generate_repo_info(self, difficulty: str) -> Dict[str, Any]:
         """Generate repository information based on difficulty"""
-        if difficulty == "easy":
-            size = random.choice(["small", "small", "medium"])
-        elif difficulty == "medium":
-            size = random.choice(["small", "medium", "medium", "large"])
-        else:
-            size = random.choice(["medium", "large", "large", "enterprise"])
-        
-        size_specs = {
-            "small": {"files": random.randint(50, 200), "loc": random.randint(5000, 10000)},
-            "medium": {"files": random.randint(200, 1000), "loc": random.randint(10000, 100000)},
-            "large": {"files": random.randint(1000, 5000), "loc": random.randint(100000, 1000000)},
-            "enterprise": {"files": random.randint(5000, 20000), "loc": random.randint(1000000, 5000000)}
-        }
-        
-        specs = size_specs[size]
+        cum_weights = self.REPO_SIZE_CUM_WEIGHTS.get(difficulty, self.REPO_SIZE_CUM_WEIGHTS["hard"])
+        size = random.choices(self.REPO_SIZES, cum_weights=cum_weights)[0]
+        (min_files, max_files), (min_loc, max_loc) = self.REPO_SIZE_RANGES[size]
         
         return {
             "size_category": size,
-            "files": specs["files"],
-            "loc": specs["loc"],
+            "files": random.randint(min_files, max_files),
+            "loc": random.randint(min_loc, max_loc),
             "age_months": random.randint(6, 60),
             "contributors": random.randint(1, 50),
             "languages": self._generate_language_distribution(),
@@ -713,9 +759,7 @@ class BugGenerator:
     
     def _generate_function_name(self) -> str:
         """Generate a function name"""
-        verbs = ["get", "set", "process", "handle", "calculate", "validate", "update", "create"]
-        nouns = ["data", "user", "order", "result", "response", "request", "item", "value"]
-        return f"{random.choice(verbs)}{random.choice(nouns).capitalize()}"
+        return random.choice(self.FUNCTION_VERBS) + random.choice(self.FUNCTION_NOUNS)
     
     def _generate_method_names(self, min_count: int, max_count: int) -> List[str]:
         """Generate multiple method names"""
@@ -761,11 +805,12 @@ class BugGenerator:
     
     def _generate_commit_hashes(self, count: int) -> List[str]:
         """Generate realistic commit hashes"""
-        return [hashlib.md5(f"{random.randint(0, 999999)}".encode()).hexdigest()[:8] for _ in range(count)]
+        # Purely cosmetic, so format random bits directly instead of hashing them
+        return [f"{random.getrandbits(32):08x}" for _ in range(count)]
     
     def _generate_date_offset(self, days_ago: int) -> str:
         """Generate a date string for given days ago"""
-        date = datetime.now() - timedelta(days=days_ago)
+        date = self._now - timedelta(days=days_ago)
         return date.strftime("%Y-%m-%d")
     
     def _get_extension(self, language: str) -> str:
@@ -891,20 +936,21 @@ class BugGenerator:
         }
         
         # Count actual distributions
-        for category in ["syntax_errors", "logic_errors", "concurrency_issues", 
-                        "memory_issues", "api_misuse", "performance_bugs", "cross_category"]:
-            category_path = self.base_path / category
-            if category_path.exists():
-                for bug_file in category_path.glob("*.json"):
-                    with open(bug_file) as f:
-                        bug_data = json.load(f)
-                        summary["languages"][bug_data["language"]] += 1
-                        if "difficulty" in bug_data:
-                            summary["difficulty_distribution"][bug_data["difficulty"]] += 1
+        bug_files = []
+        for category_dir in self._category_dirs.values():
+            if os.path.isdir(category_dir):
+                with os.scandir(category_dir) as entries:
+                    bug_files.extend(entry.path for entry in entries if entry.name.endswith(".json"))
+        
+        # Files are independent, so fan the parsing out across processes
+        with ProcessPoolExecutor() as executor:
+            for language, difficulty in executor.map(_extract_summary_fields, bug_files, chunksize=64):
+                summary["languages"][language] += 1
+                if difficulty is not None:
+                    summary["difficulty_distribution"][difficulty] += 1
         
         summary_path = self.base_path / "BENCHMARK_SUMMARY.json"
-        with open(summary_path, 'w') as f:
-            json.dump(summary, f, indent=2)
+        _write_json(summary_path, summary)
         
         print(f"\nSummary saved to {summary_path}")
 
@@ -5,22 +5,91 @@ Creates realistic codebases with bugs injected at specific commits.
 """
 
 import os
+import functools
 import json
+import multiprocessing
 import random
 import shutil
 import subprocess
+import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write data as 2-space indented JSON, using orjson when available"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+
+def _json_line(data: Any) -> bytes:
+    """Encode data as a single compact JSON line"""
+    if orjson is not None:
+        return orjson.dumps(data) + b"\n"
+    return json.dumps(data).encode() + b"\n"
+
+
+def _generate_repository_job(job: Tuple[str, str, str, int, Optional[str]]) -> Dict[str, Any]:
+    """Pool worker that generates one repository and returns its metadata"""
+    base_path, repo_name, size_category, num_bugs, layout_path = job
+    # Seed from the repository name so output does not depend on scheduling
+    generator = TestRepoGenerator(base_path, seed=repo_name)
+    return generator._generate_repository(repo_name, size_category, num_bugs,
+                                          Path(layout_path) if layout_path else None)
 
 
 class TestRepoGenerator:
     """Generate test repositories with realistic code and bug injections"""
     
-    def __init__(self, base_path: str):
+    # Flags for creating or truncating generated files
+    _WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    # Files that development history and bug injection may modify
+    SOURCE_EXTENSIONS = (".py", ".java", ".js")
+    # Every routine commit message, built once instead of formatted per commit
+    COMMIT_MESSAGES = tuple(
+        f"{prefix}: {action} {feature}"
+        for prefix in ("feat", "fix", "refactor", "docs", "test", "chore")
+        for action in ("add", "update", "improve", "optimize", "enhance", "implement")
+        for feature in ("user authentication", "data validation", "error handling",
+                        "performance", "security", "UI components")
+    )
+    # Java packages generated inside every enterprise module
+    ENTERPRISE_PACKAGES = ("controller", "service", "repository", "model", "dto", "mapper", "validator", "exception")
+    
+    def __init__(self, base_path: str, seed: Any = None):
         self.base_path = Path(base_path)
         self.repos_path = self.base_path / "test_repositories"
         self.repos_path.mkdir(exist_ok=True)
+        self._rng = random.Random(seed)
+        # Source paths of the repository whose history is being generated
+        self._source_paths: Tuple[str, ...] = ()
+        self._java_paths: Tuple[str, ...] = ()
+        
+        # Change and bug injection dispatch tables, bound once
+        self._change_types = (
+            self._add_new_method,
+            self._modify_existing_method,
+            self._add_new_file,
+            self._update_config,
+            self._add_test
+        )
+        self._bug_types = (
+            self._inject_null_pointer_bug,
+            self._inject_off_by_one_bug,
+            self._inject_race_condition_bug,
+            self._inject_memory_leak_bug,
+            self._inject_api_misuse_bug
+        )
         
     def generate_all_repos(self):
         """Generate all test repositories according to distribution"""
@@ -34,26 +103,49 @@ class TestRepoGenerator:
             ("enterprise", 5, ">1M LOC", 200)
         ]
         
-        total_repos = 0
+        # Every repository of a size shares the same starting layout (enterprise
+        # layouts are randomized), so render each once and copy it per repository
+        layouts_path = Path(tempfile.mkdtemp(prefix=".layouts_", dir=self.repos_path))
+        layout_paths = {}
+        for size_category in ("small", "medium", "large"):
+            layout_paths[size_category] = layouts_path / size_category
+            layout_paths[size_category].mkdir()
+            self._generate_layout(layout_paths[size_category], size_category)
+        
+        jobs = []
         for size_category, count, size_desc, bugs_per_repo in repo_configs:
-            print(f"\nGenerating {count} {size_category} repositories ({size_desc})...")
+            print(f"  {count} {size_category} repositories ({size_desc})")
+            layout_path = layout_paths.get(size_category)
             
             for i in range(count):
                 repo_name = f"{size_category}_repo_{i+1:02d}"
-                self._generate_repository(repo_name, size_category, bugs_per_repo)
-                total_repos += 1
-                print(f"  Created {repo_name}")
+                jobs.append((str(self.base_path), repo_name, size_category, bugs_per_repo,
+                             str(layout_path) if layout_path else None))
+        
+        # Repositories are independent, so build them in parallel; each repository's
+        # metadata is appended to a JSON-lines log as soon as it completes
+        total_repos = 0
+        try:
+            with multiprocessing.Pool(os.cpu_count()) as pool, \
+                    open(self.repos_path / "REPOSITORIES.jsonl", 'wb') as metadata_log:
+                for metadata in pool.imap_unordered(_generate_repository_job, jobs, chunksize=1):
+                    metadata_log.write(_json_line(metadata))
+                    total_repos += 1
+                    print(f"  Created {metadata['repository_name']}")
+        finally:
+            self._fast_rmtree(layouts_path)
         
         print(f"\n✓ Generated {total_repos} test repositories!")
         self._create_repos_metadata()
     
-    def _generate_repository(self, repo_name: str, size_category: str, num_bugs: int):
-        """Generate a single repository with injected bugs"""
+    def _generate_repository(self, repo_name: str, size_category: str, num_bugs: int,
+                             layout_path: Optional[Path] = None) -> Dict[str, Any]:
+        """Generate a single repository with injected bugs, optionally copying a prebuilt layout"""
         repo_path = self.repos_path / repo_name
         
         # Remove if exists
         if repo_path.exists():
-            shutil.rmtree(repo_path)
+            self._fast_rmtree(repo_path)
         
         repo_path.mkdir()
         
@@ -61,6 +153,19 @@ class TestRepoGenerator:
         self._init_git_repo(repo_path)
         
         # Generate code structure based on size
+        if layout_path is not None:
+            self._copy_layout(layout_path, repo_path)
+        else:
+            self._generate_layout(repo_path, size_category)
+        
+        # Generate initial commit and development history with bug injections
+        self._generate_development_history(repo_path, num_bugs)
+        
+        # Create repo metadata
+        return self._create_repo_metadata(repo_path, repo_name, size_category, num_bugs)
+    
+    def _generate_layout(self, repo_path: Path, size_category: str):
+        """Generate the starting code structure for a repository size"""
         if size_category == "small":
             self._generate_small_repo(repo_path)
         elif size_category == "medium":
@@ -69,26 +174,33 @@ class TestRepoGenerator:
             self._generate_large_repo(repo_path)
         else:  # enterprise
             self._generate_enterprise_repo(repo_path)
+    
+    def _copy_layout(self, layout_path: Path, repo_path: Path):
+        """Copy a prebuilt layout into a repository, as a copy-on-write clone where supported"""
+        try:
+            subprocess.run(["cp", "-a", "--reflink=auto", f"{layout_path}/.", str(repo_path)],
+                           check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except (OSError, subprocess.CalledProcessError):
+            shutil.copytree(layout_path, repo_path, dirs_exist_ok=True)
+    
+    def _fast_rmtree(self, path: Path):
+        """Remove a directory tree with the native tool, falling back to shutil.rmtree"""
+        if os.name == "nt":
+            command = ["cmd", "/c", "rd", "/s", "/q", str(path)]
+        else:
+            command = ["rm", "-rf", str(path)]
         
-        # Create initial commit
-        self._git_commit(repo_path, "Initial commit")
-        
-        # Generate development history with bug injections
-        self._generate_development_history(repo_path, num_bugs)
-        
-        # Create repo metadata
-        self._create_repo_metadata(repo_path, repo_name, size_category, num_bugs)
+        try:
+            subprocess.run(command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except (OSError, subprocess.CalledProcessError):
+            shutil.rmtree(path)
     
     def _init_git_repo(self, repo_path: Path):
         """Initialize a git repository"""
-        subprocess.run(["git", "init"], cwd=repo_path, capture_output=True)
-        subprocess.run(["git", "config", "user.name", "MRR Generator"], cwd=repo_path, capture_output=True)
-        subprocess.run(["git", "config", "user.email", "mrr@kodezi.com"], cwd=repo_path, capture_output=True)
-    
-    def _git_commit(self, repo_path: Path, message: str):
-        """Create a git commit"""
-        subprocess.run(["git", "add", "-A"], cwd=repo_path, capture_output=True)
-        subprocess.run(["git", "commit", "-m", message], cwd=repo_path, capture_output=True)
+        subprocess.run(["git", "init"], cwd=repo_path, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        # Append the identity directly rather than spawning two `git config` processes
+        with open(repo_path / ".git" / "config", "a") as f:
+            f.write("[user]\n\tname = MRR Generator\n\temail = mrr@kodezi.com\n")
     
     def _generate_small_repo(self, repo_path: Path):
         """Generate a small repository structure (<10K LOC)"""
@@ -102,8 +214,7 @@ class TestRepoGenerator:
             "config"
         ]
         
-        for dir_path in dirs:
-            (repo_path / dir_path).mkdir(parents=True, exist_ok=True)
+        self._make_dirs(repo_path, dirs)
         
         # Generate Python files
         self._create_file(repo_path / "src/app.py", self._generate_python_app_code())
@@ -137,8 +248,7 @@ class TestRepoGenerator:
             "config"
         ]
         
-        for dir_path in dirs:
-            (repo_path / dir_path).mkdir(parents=True, exist_ok=True)
+        self._make_dirs(repo_path, dirs)
         
         # Generate Java backend files
         self._create_file(repo_path / "backend/src/main/java/com/example/Application.java", 
@@ -169,8 +279,9 @@ class TestRepoGenerator:
         # Microservices architecture
         services = ["auth", "user", "order", "payment", "notification", "analytics"]
         
+        dirs = []
         for service in services:
-            service_dirs = [
+            dirs.extend([
                 f"services/{service}/src/main/java/com/example/{service}/controller",
                 f"services/{service}/src/main/java/com/example/{service}/service",
                 f"services/{service}/src/main/java/com/example/{service}/repository",
@@ -178,33 +289,28 @@ class TestRepoGenerator:
                 f"services/{service}/src/main/java/com/example/{service}/config",
                 f"services/{service}/src/test/java/com/example/{service}",
                 f"services/{service}/src/main/resources"
-            ]
-            
-            for dir_path in service_dirs:
-                (repo_path / dir_path).mkdir(parents=True, exist_ok=True)
-            
-            # Generate multiple files per service
-            self._generate_service_files(repo_path, service)
+            ])
         
         # Shared libraries
-        lib_dirs = [
+        dirs.extend([
             "libs/common/src",
             "libs/security/src",
             "libs/messaging/src"
-        ]
-        
-        for dir_path in lib_dirs:
-            (repo_path / dir_path).mkdir(parents=True, exist_ok=True)
+        ])
         
         # Infrastructure and deployment
-        infra_dirs = [
+        dirs.extend([
             "infrastructure/kubernetes",
             "infrastructure/terraform",
             "infrastructure/monitoring"
-        ]
+        ])
         
-        for dir_path in infra_dirs:
-            (repo_path / dir_path).mkdir(parents=True, exist_ok=True)
+        # Create the whole layout in one pass before writing any files
+        self._make_dirs(repo_path, dirs)
+        
+        for service in services:
+            # Generate multiple files per service
+            self._generate_service_files(repo_path, service)
         
         self._create_file(repo_path / "README.md", self._generate_readme("Microservices Platform"))
     
@@ -216,29 +322,30 @@ class TestRepoGenerator:
             "reporting", "admin", "mobile", "analytics", "ml"
         ]
         
+        dirs = []
         for module in modules:
-            module_dirs = [
+            dirs.extend([
                 f"modules/{module}/src/main/java",
                 f"modules/{module}/src/main/resources",
                 f"modules/{module}/src/test/java",
                 f"modules/{module}/src/test/resources"
-            ]
-            
-            for dir_path in module_dirs:
-                (repo_path / dir_path).mkdir(parents=True, exist_ok=True)
-            
-            # Generate many files per module
-            self._generate_enterprise_module_files(repo_path, module)
+            ])
+            dirs.extend(f"modules/{module}/src/main/java/com/enterprise/{module}/{package}"
+                        for package in self.ENTERPRISE_PACKAGES)
         
         # Legacy code sections
-        legacy_dirs = [
+        dirs.extend([
             "legacy/cobol-bridge",
             "legacy/mainframe-connector",
             "legacy/batch-jobs"
-        ]
+        ])
         
-        for dir_path in legacy_dirs:
-            (repo_path / dir_path).mkdir(parents=True, exist_ok=True)
+        # Create the whole layout in one pass before writing any files
+        self._make_dirs(repo_path, dirs)
+        
+        for module in modules:
+            # Generate many files per module
+            self._generate_enterprise_module_files(repo_path, module)
         
         self._create_file(repo_path / "README.md", self._generate_readme("Enterprise System"))
     
@@ -249,65 +356,112 @@ class TestRepoGenerator:
         start_date = current_date - timedelta(days=365)
         
         # Create commits over time
-        num_commits = random.randint(500, 2000)
-        bug_injection_points = sorted(random.sample(range(50, num_commits), min(num_bugs, num_commits - 50)))
+        num_commits = self._rng.randint(500, 2000)
+        bug_injection_points = sorted(self._rng.sample(range(50, num_commits), min(num_bugs, num_commits - 50)))
+        bug_indices = {commit_index: bug_index for bug_index, commit_index in enumerate(bug_injection_points)}
+        
+        # Commit timestamps, spread evenly over the year in whole days
+        start_timestamp = int(start_date.timestamp())
+        commit_timestamps = [start_timestamp + (365 * i // num_commits) * 86400 for i in range(num_commits)]
+        
+        # Every commit, starting with the initial one, is streamed to a single
+        # `git fast-import` process; changes are applied to an in-memory copy of
+        # the source files, so the working tree is never rescanned
+        tree = self._load_files(repo_path)
+        branch = self._current_branch(repo_path)
+        importer = subprocess.Popen(["git", "fast-import", "--quiet", "--date-format=raw"],
+                                    cwd=repo_path, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL)
+        self._write_fast_import_commit(importer.stdin, branch, int(current_date.timestamp()),
+                                       "Initial commit", tree)
+        files = {path: content for path, content in tree.items() if path.endswith(self.SOURCE_EXTENSIONS)}
+        # The set of source files never changes, so the helpers share these path tuples
+        self._source_paths = tuple(files)
+        self._java_paths = tuple(path for path in self._source_paths if path.endswith(".java"))
         
         for i in range(num_commits):
-            # Calculate commit date
-            progress = i / num_commits
-            commit_date = start_date + timedelta(days=int(365 * progress))
-            
             # Make some changes
-            self._make_random_changes(repo_path)
+            changed = set(self._make_random_changes(files))
             
             # Check if this is a bug injection point
-            if i in bug_injection_points:
-                bug_index = bug_injection_points.index(i)
-                self._inject_bug(repo_path, f"bug_{bug_index+1:03d}")
+            bug_index = bug_indices.get(i)
+            if bug_index is not None:
+                changed.update(self._inject_bug(files, f"bug_{bug_index+1:03d}"))
+            
+            # Like `git commit`, skip commits that would not change anything, and
+            # do so before any work is spent on their message
+            if not changed:
+                continue
+            
+            if bug_index is not None:
                 commit_msg = f"Feature: Add new functionality (contains bug_{bug_index+1:03d})"
             else:
                 commit_msg = self._generate_commit_message()
             
-            # Set commit date and create commit
-            env = os.environ.copy()
-            env['GIT_AUTHOR_DATE'] = commit_date.isoformat()
-            env['GIT_COMMITTER_DATE'] = commit_date.isoformat()
-            
-            subprocess.run(["git", "add", "-A"], cwd=repo_path, capture_output=True)
-            subprocess.run(["git", "commit", "-m", commit_msg], cwd=repo_path, capture_output=True, env=env)
-    
-    def _make_random_changes(self, repo_path: Path):
-        """Make random realistic changes to repository"""
-        change_types = [
-            self._add_new_method,
-            self._modify_existing_method,
-            self._add_new_file,
-            self._update_config,
-            self._add_test
-        ]
+            self._write_fast_import_commit(
+                importer.stdin, branch, commit_timestamps[i], commit_msg,
+                {path: files[path] for path in sorted(changed)}
+            )
         
-        # Make 1-5 changes
-        num_changes = random.randint(1, 5)
-        for _ in range(num_changes):
-            change_func = random.choice(change_types)
-            change_func(repo_path)
-    
-    def _inject_bug(self, repo_path: Path, bug_id: str):
-        """Inject a specific bug into the repository"""
-        bug_types = [
-            self._inject_null_pointer_bug,
-            self._inject_off_by_one_bug,
-            self._inject_race_condition_bug,
-            self._inject_memory_leak_bug,
-            self._inject_api_misuse_bug
-        ]
+        importer.stdin.close()
+        importer.wait()
         
-        bug_func = random.choice(bug_types)
-        bug_func(repo_path, bug_id)
+        # Sync the index and working tree with the imported history
+        subprocess.run(["git", "reset", "--hard", "-q"], cwd=repo_path,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    
+    def _load_files(self, repo_path: Path) -> Dict[str, str]:
+        """Read every file outside .git, keyed by path relative to the repo root"""
+        files = {}
+        for dir_path, dir_names, file_names in os.walk(repo_path):
+            if dir_path == str(repo_path):
+                dir_names.remove(".git")
+            rel_dir = os.path.relpath(dir_path, repo_path)
+            for file_name in file_names:
+                rel_path = file_name if rel_dir == "." else f"{rel_dir}/{file_name}".replace(os.sep, "/")
+                with open(os.path.join(dir_path, file_name)) as f:
+                    files[rel_path] = f.read()
+        return files
+    
+    def _current_branch(self, repo_path: Path) -> str:
+        """Return the full ref name of the checked out branch"""
+        result = subprocess.run(["git", "symbolic-ref", "HEAD"], cwd=repo_path,
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        return result.stdout.strip()
+    
+    def _write_fast_import_commit(self, stream, branch: str, timestamp: int,
+                                  message: str, changes: Dict[str, str]):
+        """Write one commit, with its changed files inlined, to a `git fast-import` stream"""
+        message_bytes = message.encode()
+        # Author and committer dates go straight into the stream; no GIT_*_DATE environment needed
+        signature = b"MRR Generator <mrr@kodezi.com> %d +0000" % timestamp
+        chunks = [
+            b"commit %s\n" % branch.encode(),
+            b"author %s\n" % signature,
+            b"committer %s\n" % signature,
+            b"data %d\n%s\n" % (len(message_bytes), message_bytes)
+        ]
+        for path, content in changes.items():
+            blob = content.encode()
+            chunks.append(b"M 100644 inline %s\ndata %d\n%s\n" % (path.encode(), len(blob), blob))
+        stream.write(b"".join(chunks))
+    
+    def _make_random_changes(self, files: Dict[str, str]) -> List[str]:
+        """Make random realistic changes to the source files, returning the modified paths"""
+        # Make 1-5 changes
+        num_changes = self._rng.randint(1, 5)
+        changed = []
+        for change_func in self._rng.choices(self._change_types, k=num_changes):
+            changed.extend(change_func(files))
+        return changed
+    
+    def _inject_bug(self, files: Dict[str, str], bug_id: str) -> List[str]:
+        """Inject a specific bug into the source files, returning the modified paths"""
+        bug_func = self._rng.choice(self._bug_types)
+        return bug_func(files, bug_id)
     
     # Code generation helpers
-    def _generate_python_app_code(self) -> str:
-        return '''from flask import Flask, jsonify
+    def _generate_python_app_code(self) -> bytes:
+        return b'''from flask import Flask, jsonify
 from controllers.user import user_blueprint
 from controllers.auth import auth_blueprint
 import config.settings as settings
@@ -327,8 +481,8 @@ if __name__ == '__main__':
     app.run(debug=settings.DEBUG, port=settings.PORT)
 '''
 
-    def _generate_python_controller(self) -> str:
-        return '''from flask import Blueprint, request, jsonify
+    def _generate_python_controller(self) -> bytes:
+        return b'''from flask import Blueprint, request, jsonify
 from models.user import User
 from utils.helpers import validate_email
 
@@ -360,8 +514,8 @@ def create_user():
     return jsonify(user.to_dict()), 201
 '''
 
-    def _generate_python_auth_controller(self) -> str:
-        return '''from flask import Blueprint, request, jsonify
+    def _generate_python_auth_controller(self) -> bytes:
+        return b'''from flask import Blueprint, request, jsonify
 import jwt
 from datetime import datetime, timedelta
 from models.user import User
@@ -396,8 +550,8 @@ def logout():
     return jsonify({'message': 'Logged out successfully'})
 '''
 
-    def _generate_python_model(self) -> str:
-        return '''from datetime import datetime
+    def _generate_python_model(self) -> bytes:
+        return b'''from datetime import datetime
 from werkzeug.security import generate_password_hash, check_password_hash
 
 class User:
@@ -455,8 +609,8 @@ class User:
         }
 '''
 
-    def _generate_python_utils(self) -> str:
-        return '''import re
+    def _generate_python_utils(self) -> bytes:
+        return b'''import re
 from functools import wraps
 from flask import request, jsonify
 import jwt
@@ -507,8 +661,8 @@ def paginate(query, page=1, per_page=20):
     }
 '''
 
-    def _generate_python_test(self) -> str:
-        return '''import unittest
+    def _generate_python_test(self) -> bytes:
+        return b'''import unittest
 from app import app
 from models.user import User
 
@@ -549,8 +703,8 @@ if __name__ == '__main__':
     unittest.main()
 '''
 
-    def _generate_python_config(self) -> str:
-        return '''import os
+    def _generate_python_config(self) -> bytes:
+        return b'''import os
 from datetime import timedelta
 
 # Flask settings
@@ -583,8 +737,8 @@ SESSION_COOKIE_SECURE = not DEBUG
 SESSION_COOKIE_HTTPONLY = True
 '''
 
-    def _generate_java_application(self) -> str:
-        return '''package com.example;
+    def _generate_java_application(self) -> bytes:
+        return b'''package com.example;
 
 import org.springframework.boot.SpringApplication;
 import org.springframework.boot.autoconfigure.SpringBootApplication;
@@ -615,8 +769,8 @@ public class Application {
 }
 '''
 
-    def _generate_java_controller(self) -> str:
-        return '''package com.example.api;
+    def _generate_java_controller(self) -> bytes:
+        return b'''package com.example.api;
 
 import com.example.model.User;
 import com.example.service.UserService;
@@ -676,8 +830,8 @@ public class UserController {
 }
 '''
 
-    def _generate_java_service(self) -> str:
-        return '''package com.example.service;
+    def _generate_java_service(self) -> bytes:
+        return b'''package com.example.service;
 
 import com.example.model.User;
 import com.example.repository.UserRepository;
@@ -732,8 +886,8 @@ public class UserService {
 }
 '''
 
-    def _generate_java_repository(self) -> str:
-        return '''package com.example.repository;
+    def _generate_java_repository(self) -> bytes:
+        return b'''package com.example.repository;
 
 import com.example.model.User;
 import org.springframework.data.jpa.repository.JpaRepository;
@@ -757,8 +911,8 @@ public interface UserRepository extends JpaRepository<User, Long> {
 }
 '''
 
-    def _generate_java_model(self) -> str:
-        return '''package com.example.model;
+    def _generate_java_model(self) -> bytes:
+        return b'''package com.example.model;
 
 import javax.persistence.*;
 import javax.validation.constraints.Email;
@@ -830,8 +984,8 @@ public class User {
 }
 '''
 
-    def _generate_react_app(self) -> str:
-        return '''import React, { useState, useEffect } from 'react';
+    def _generate_react_app(self) -> bytes:
+        return b'''import React, { useState, useEffect } from 'react';
 import UserList from './components/UserList';
 import api from './services/api';
 import './App.css';
@@ -877,8 +1031,8 @@ function App() {
 export default App;
 '''
 
-    def _generate_react_component(self) -> str:
-        return '''import React from 'react';
+    def _generate_react_component(self) -> bytes:
+        return b'''import React from 'react';
 import PropTypes from 'prop-types';
 
 const UserList = ({ users, onRefresh }) => {
@@ -935,8 +1089,8 @@ UserList.propTypes = {
 export default UserList;
 '''
 
-    def _generate_js_service(self) -> str:
-        return '''const API_BASE_URL = process.env.REACT_APP_API_URL || 'http://localhost:8080/api';
+    def _generate_js_service(self) -> bytes:
+        return b'''const API_BASE_URL = process.env.REACT_APP_API_URL || 'http://localhost:8080/api';
 
 class ApiService {
   async request(endpoint, options = {}) {
@@ -990,8 +1144,8 @@ class ApiService {
 export default new ApiService();
 '''
 
-    def _generate_js_utils(self) -> str:
-        return '''export const formatDate = (date) => {
+    def _generate_js_utils(self) -> bytes:
+        return b'''export const formatDate = (date) => {
   const options = { year: 'numeric', month: 'long', day: 'numeric' };
   return new Date(date).toLocaleDateString(undefined, options);
 };
@@ -1031,8 +1185,8 @@ export const sortByProperty = (array, property, ascending = true) => {
 };
 '''
 
-    def _generate_requirements(self) -> str:
-        return '''Flask==2.3.2
+    def _generate_requirements(self) -> bytes:
+        return b'''Flask==2.3.2
 Flask-CORS==4.0.0
 PyJWT==2.8.0
 Werkzeug==2.3.6
@@ -1044,8 +1198,8 @@ flake8==6.0.0
 black==23.7.0
 '''
 
-    def _generate_package_json(self) -> str:
-        return '''{
+    def _generate_package_json(self) -> bytes:
+        return b'''{
   "name": "frontend",
   "version": "1.0.0",
   "private": true,
@@ -1082,8 +1236,8 @@ black==23.7.0
 }
 '''
 
-    def _generate_pom_xml(self) -> str:
-        return '''<?xml version="1.0" encoding="UTF-8"?>
+    def _generate_pom_xml(self) -> bytes:
+        return b'''<?xml version="1.0" encoding="UTF-8"?>
 <project xmlns="http://maven.apache.org/POM/4.0.0"
          xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
          xsi:schemaLocation="http://maven.apache.org/POM/4.0.0 
@@ -1141,8 +1295,8 @@ black==23.7.0
 </project>
 '''
 
-    def _generate_docker_compose(self) -> str:
-        return '''version: '3.8'
+    def _generate_docker_compose(self) -> bytes:
+        return b'''version: '3.8'
 
 services:
   backend:
@@ -1189,7 +1343,10 @@ networks:
     driver: bridge
 '''
 
-    def _generate_readme(self, project_type: str) -> str:
+    # Parameterized templates are rendered once per argument set and reused across repositories
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _generate_readme(project_type: str) -> bytes:
         return f'''# {project_type}
 
 This is a test repository for the Kodezi Chronos MRR benchmark.
@@ -1216,10 +1373,10 @@ Bugs have been injected at specific commits throughout the development history.
 ## Warning
 
 This is a synthetic repository created for benchmark purposes. Do not use in production.
-'''
+'''.encode()
 
-    def _generate_gitignore(self) -> str:
-        return '''# Python
+    def _generate_gitignore(self) -> bytes:
+        return b'''# Python
 __pycache__/
 *.py[cod]
 *$py.class
@@ -1275,10 +1432,20 @@ logs/
     # Helper methods for generating service files
     def _generate_service_files(self, repo_path: Path, service: str):
         """Generate files for a microservice"""
+        package_path = repo_path / f"services/{service}/src/main/java/com/example/{service}"
+        files = [
+            (package_path / f"controller/{service.capitalize()}Controller.java", self._generate_service_controller(service)),
+            (package_path / f"service/{service.capitalize()}Service.java", self._generate_service_class(service))
+        ]
+        for file_path, content in files:
+            self._create_file(file_path, content)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _generate_service_controller(service: str) -> bytes:
+        """Render the controller class for a microservice"""
         base_package = f"com.example.{service}"
-        
-        # Controller
-        controller_code = f'''package {base_package}.controller;
+        return f'''package {base_package}.controller;
 
 import org.springframework.web.bind.annotation.*;
 import {base_package}.service.{service.capitalize()}Service;
@@ -1288,14 +1455,14 @@ import {base_package}.service.{service.capitalize()}Service;
 public class {service.capitalize()}Controller {{
     // Controller implementation
 }}
-'''
-        self._create_file(
-            repo_path / f"services/{service}/src/main/java/com/example/{service}/controller/{service.capitalize()}Controller.java",
-            controller_code
-        )
-        
-        # Service
-        service_code = f'''package {base_package}.service;
+'''.encode()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _generate_service_class(service: str) -> bytes:
+        """Render the service class for a microservice"""
+        base_package = f"com.example.{service}"
+        return f'''package {base_package}.service;
 
 import org.springframework.stereotype.Service;
 
@@ -1303,51 +1470,48 @@ import org.springframework.stereotype.Service;
 public class {service.capitalize()}Service {{
     // Service implementation
 }}
-'''
-        self._create_file(
-            repo_path / f"services/{service}/src/main/java/com/example/{service}/service/{service.capitalize()}Service.java",
-            service_code
-        )
+'''.encode()
 
     def _generate_enterprise_module_files(self, repo_path: Path, module: str):
         """Generate files for an enterprise module"""
         # Generate multiple packages and classes per module
-        packages = ["controller", "service", "repository", "model", "dto", "mapper", "validator", "exception"]
-        
-        for package in packages:
-            for i in range(random.randint(5, 15)):  # Multiple classes per package
+        for package in self.ENTERPRISE_PACKAGES:
+            files = []
+            for i in range(self._rng.randint(5, 15)):  # Multiple classes per package
                 class_name = f"{module.capitalize()}{package.capitalize()}{i+1}"
-                file_path = repo_path / f"modules/{module}/src/main/java/com/enterprise/{module}/{package}/{class_name}.java"
-                
-                code = f'''package com.enterprise.{module}.{package};
+                files.append((f"{class_name}.java", self._generate_enterprise_class(module, package, class_name)))
+            
+            # Render the whole package first, then write it relative to one directory handle
+            self._write_files(repo_path / f"modules/{module}/src/main/java/com/enterprise/{module}/{package}", files)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _generate_enterprise_class(module: str, package: str, class_name: str) -> bytes:
+        """Render a class stub for an enterprise module package"""
+        return f'''package com.enterprise.{module}.{package};
 
 public class {class_name} {{
     // Enterprise implementation
 }}
-'''
-                self._create_file(file_path, code)
+'''.encode()
 
     # Methods for making changes and injecting bugs
-    def _add_new_method(self, repo_path: Path):
+    def _add_new_method(self, files: Dict[str, str]) -> List[str]:
         """Add a new method to a random file"""
         # Find a random source file
-        source_files = list(repo_path.glob("**/*.py")) + list(repo_path.glob("**/*.java")) + list(repo_path.glob("**/*.js"))
-        if not source_files:
-            return
+        if not self._source_paths:
+            return []
         
-        file_path = random.choice(source_files)
-        
-        # Read existing content
-        content = file_path.read_text()
+        file_path = self._rng.choice(self._source_paths)
         
         # Add a simple method
-        if file_path.suffix == '.py':
+        if file_path.endswith('.py'):
             new_method = '''
 def new_feature():
     """New feature implementation"""
     return "Feature implemented"
 '''
-        elif file_path.suffix == '.java':
+        elif file_path.endswith('.java'):
             new_method = '''
     public String newFeature() {
         return "Feature implemented";
@@ -1361,36 +1525,36 @@ function newFeature() {
 '''
         
         # Append the method
-        file_path.write_text(content + new_method)
+        files[file_path] += new_method
+        return [file_path]
 
-    def _modify_existing_method(self, repo_path: Path):
+    def _modify_existing_method(self, files: Dict[str, str]) -> List[str]:
         """Modify an existing method"""
         # Implementation would modify existing code
-        pass
+        return []
 
-    def _add_new_file(self, repo_path: Path):
+    def _add_new_file(self, files: Dict[str, str]) -> List[str]:
         """Add a new file to the repository"""
         # Implementation would add new files
-        pass
+        return []
 
-    def _update_config(self, repo_path: Path):
+    def _update_config(self, files: Dict[str, str]) -> List[str]:
         """Update configuration files"""
         # Implementation would modify config files
-        pass
+        return []
 
-    def _add_test(self, repo_path: Path):
+    def _add_test(self, files: Dict[str, str]) -> List[str]:
         """Add a new test"""
         # Implementation would add test files
-        pass
+        return []
 
     # Bug injection methods
-    def _inject_null_pointer_bug(self, repo_path: Path, bug_id: str):
+    def _inject_null_pointer_bug(self, files: Dict[str, str], bug_id: str) -> List[str]:
         """Inject a null pointer bug"""
         # Find a suitable file
-        java_files = list(repo_path.glob("**/*.java"))
-        if java_files:
-            file_path = random.choice(java_files)
-            content = file_path.read_text()
+        if self._java_paths:
+            file_path = self._rng.choice(self._java_paths)
+            content = files[file_path]
             
             # Simple null pointer injection
             buggy_content = content.replace(
@@ -1399,47 +1563,81 @@ function newFeature() {
             )
             
             if buggy_content != content:
-                file_path.write_text(buggy_content)
+                files[file_path] = buggy_content
+                return [file_path]
+        return []
 
-    def _inject_off_by_one_bug(self, repo_path: Path, bug_id: str):
+    def _inject_off_by_one_bug(self, files: Dict[str, str], bug_id: str) -> List[str]:
         """Inject an off-by-one error"""
         # Implementation would inject off-by-one errors
-        pass
+        return []
 
-    def _inject_race_condition_bug(self, repo_path: Path, bug_id: str):
+    def _inject_race_condition_bug(self, files: Dict[str, str], bug_id: str) -> List[str]:
         """Inject a race condition bug"""
         # Implementation would remove synchronization
-        pass
+        return []
 
-    def _inject_memory_leak_bug(self, repo_path: Path, bug_id: str):
+    def _inject_memory_leak_bug(self, files: Dict[str, str], bug_id: str) -> List[str]:
         """Inject a memory leak"""
         # Implementation would prevent cleanup
-        pass
+        return []
 
-    def _inject_api_misuse_bug(self, repo_path: Path, bug_id: str):
+    def _inject_api_misuse_bug(self, files: Dict[str, str], bug_id: str) -> List[str]:
         """Inject an API misuse bug"""
         # Implementation would use deprecated methods
-        pass
+        return []
 
     def _generate_commit_message(self) -> str:
         """Generate a realistic commit message"""
-        prefixes = ["feat", "fix", "refactor", "docs", "test", "chore"]
-        actions = ["add", "update", "improve", "optimize", "enhance", "implement"]
-        features = ["user authentication", "data validation", "error handling", "performance", "security", "UI components"]
-        
-        prefix = random.choice(prefixes)
-        action = random.choice(actions)
-        feature = random.choice(features)
-        
-        return f"{prefix}: {action} {feature}"
+        return self._rng.choice(self.COMMIT_MESSAGES)
 
-    def _create_file(self, path: Path, content: str):
-        """Create a file with content"""
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(content)
+    def _make_dirs(self, repo_path: Path, dirs: List[str]):
+        """Create directories, skipping entries that are parents of other entries"""
+        leaves = set(dirs)
+        for dir_path in dirs:
+            parent = os.path.dirname(dir_path)
+            while parent:
+                leaves.discard(parent)
+                parent = os.path.dirname(parent)
+        
+        for dir_path in sorted(leaves):
+            os.makedirs(repo_path / dir_path, exist_ok=True)
 
-    def _create_repo_metadata(self, repo_path: Path, repo_name: str, size_category: str, num_bugs: int):
-        """Create metadata file for the repository"""
+    def _create_file(self, path: Path, content: Union[str, bytes]):
+        """Create a file with content; the parent directory must already exist"""
+        fd = os.open(path, self._WRITE_FLAGS, 0o644)
+        try:
+            self._write_all(fd, content)
+        finally:
+            os.close(fd)
+
+    def _write_files(self, dir_path: Path, files: List[Tuple[str, Union[str, bytes]]]):
+        """Create several files in one existing directory, resolving the directory path once"""
+        if os.open not in os.supports_dir_fd:
+            for name, content in files:
+                self._create_file(dir_path / name, content)
+            return
+        
+        dir_fd = os.open(dir_path, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+        try:
+            for name, content in files:
+                fd = os.open(name, self._WRITE_FLAGS, 0o644, dir_fd=dir_fd)
+                try:
+                    self._write_all(fd, content)
+                finally:
+                    os.close(fd)
+        finally:
+            os.close(dir_fd)
+
+    def _write_all(self, fd: int, content: Union[str, bytes]):
+        """Write all of content to an open file descriptor"""
+        data = memoryview(content if isinstance(content, bytes) else content.encode())
+        while data:
+            data = data[os.write(fd, data):]
+
+    def _create_repo_metadata(self, repo_path: Path, repo_name: str, size_category: str,
+                              num_bugs: int) -> Dict[str, Any]:
+        """Create metadata file for the repository and return the metadata"""
         metadata = {
             "repository_name": repo_name,
             "size_category": size_category,
@@ -1449,8 +1647,8 @@ function newFeature() {
         }
         
         metadata_path = repo_path / ".mrr_metadata.json"
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        _write_json(metadata_path, metadata)
+        return metadata
 
     def _create_repos_metadata(self):
         """Create overall metadata for all repositories"""
@@ -1469,8 +1667,7 @@ function newFeature() {
         }
         
         metadata_path = self.repos_path / "REPOSITORIES_METADATA.json"
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        _write_json(metadata_path, metadata)
 
 
 def main():
@@ -5,14 +5,20 @@ This module implements the core evaluation metrics for the MRR benchmark.
 Note: The Kodezi Chronos model is proprietary and only available via Kodezi OS (Q1 2026).
 """
 
+import functools
 import numpy as np
-from typing import List, Dict, Set, Tuple, Any
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import List, Dict, Set, Tuple, Any, Optional
 from dataclasses import dataclass
 
 
 @dataclass
 class RetrievalResult:
     """Container for retrieval results"""
+    __slots__ = ('retrieved_files', 'retrieved_commits', 'retrieved_tokens',
+                 'used_tokens', 'retrieval_time')
+    
     retrieved_files: List[str]
     retrieved_commits: List[str]
     retrieved_tokens: int
@@ -23,6 +29,8 @@ class RetrievalResult:
 @dataclass
 class DebugResult:
     """Container for debugging results"""
+    __slots__ = ('proposed_fix', 'fix_location', 'test_results', 'iterations', 'total_time')
+    
     proposed_fix: str
     fix_location: Dict[str, Any]
     test_results: Dict[str, bool]
@@ -30,6 +38,25 @@ class DebugResult:
     total_time: float
 
 
+@functools.lru_cache(maxsize=8192)
+def _relevant_set(files: Tuple[str, ...], commits: Tuple[str, ...]) -> frozenset:
+    """Relevant artifact set for a ground truth, shared across evaluations"""
+    return frozenset(files).union(commits)
+
+
+@functools.lru_cache(maxsize=None)
+def _empty_ranking_metrics(ks: Tuple[int, ...], f1_k: int, has_relevant: bool) -> Dict[str, float]:
+    """Retrieval scores for an empty ranking, which depend only on the cutoffs"""
+    # Nothing was retrieved, so only recall can be non-zero (1.0 when nothing is relevant)
+    recall = 0.0 if has_relevant else 1.0
+    metrics = {f'precision_at_{k}': 0.0 for k in ks}
+    metrics.update({f'recall_at_{k}': recall for k in ks})
+    metrics[f'f1_at_{f1_k}'] = 0.0
+    metrics['mrr'] = 0.0
+    metrics['average_precision'] = 0.0
+    return metrics
+
+
 class MRRMetrics:
     """
     Evaluation metrics for the Multi Random Retrieval benchmark.
@@ -183,6 +210,64 @@ class MRRMetrics:
             return 0.0
             
         return sum(precisions) / len(relevant)
+    
+    @staticmethod
+    def compute_all(
+        retrieved: List[str],
+        relevant: Set[str],
+        ks: Tuple[int, ...] = (5, 10, 20),
+        f1_k: int = 10
+    ) -> Dict[str, float]:
+        """
+        Calculate all retrieval metrics from a single pass over the ranking.
+        
+        Equivalent to calling precision_at_k and recall_at_k for each cutoff,
+        f1_at_k, mean_reciprocal_rank and average_precision, but membership is
+        tested once per retrieved item and every score is derived from the
+        ranks of the hits.
+        
+        Args:
+            retrieved: Ranked list of retrieved artifact IDs
+            relevant: Set of relevant artifact IDs
+            ks: Cutoff values for precision and recall
+            f1_k: Cutoff value for F1
+            
+        Returns:
+            Dict of retrieval metric scores
+        """
+        n = len(retrieved)
+        if n == 0:
+            # Timed-out retrievals come back empty; their scores are constant
+            return dict(_empty_ranking_metrics(tuple(ks), f1_k, bool(relevant)))
+        
+        # Sorted 1-based ranks of the relevant items; the number of hits within
+        # the top k is then a binary search instead of another scan
+        positions = [i for i, item in enumerate(retrieved, 1) if item in relevant]
+        
+        def found_at(k: int) -> int:
+            return bisect_right(positions, k)
+        
+        def precision(k: int) -> float:
+            return found_at(k) / min(k, n) if k > 0 and n > 0 else 0.0
+        
+        def recall(k: int) -> float:
+            return found_at(k) / len(relevant) if relevant else 1.0
+        
+        metrics = {f'precision_at_{k}': precision(k) for k in ks}
+        metrics.update({f'recall_at_{k}': recall(k) for k in ks})
+        
+        p, r = precision(f1_k), recall(f1_k)
+        metrics[f'f1_at_{f1_k}'] = 2 * (p * r) / (p + r) if p + r else 0.0
+        
+        metrics['mrr'] = 1.0 / positions[0] if positions else 0.0
+        if relevant and positions:
+            metrics['average_precision'] = sum(
+                found / position for found, position in enumerate(positions, 1)
+            ) / len(relevant)
+        else:
+            metrics['average_precision'] = 0.0
+        
+        return metrics
 
 
 class MRRBenchmarkEvaluator:
@@ -190,8 +275,20 @@ class MRRBenchmarkEvaluator:
     Complete evaluator for the MRR benchmark.
     """
     
-    def __init__(self):
+    def __init__(self, cache_retrieval_metrics: bool = False, cache_size: int = 8192):
+        """
+        Args:
+            cache_retrieval_metrics: Reuse retrieval scores for repeated
+                (ranking, relevant set) pairs, as in ablation sweeps that only
+                swap the debug result. Off by default: distinct rankings never
+                hit the cache and would only pay for building its keys.
+            cache_size: Most recently used rankings kept when caching
+        """
         self.metrics = MRRMetrics()
+        self._retrieval_metric_cache: Optional[OrderedDict] = (
+            OrderedDict() if cache_retrieval_metrics else None
+        )
+        self._cache_size = cache_size
         
     def evaluate_single_task(
         self,
@@ -212,20 +309,26 @@ class MRRBenchmarkEvaluator:
         """
         # Combine files and commits for retrieval evaluation
         retrieved = retrieval_result.retrieved_files + retrieval_result.retrieved_commits
-        relevant = set(ground_truth['files_involved'] + ground_truth['commits_relevant'])
-        
-        # Calculate retrieval metrics
-        metrics = {
-            'precision_at_5': self.metrics.precision_at_k(retrieved, relevant, 5),
-            'precision_at_10': self.metrics.precision_at_k(retrieved, relevant, 10),
-            'precision_at_20': self.metrics.precision_at_k(retrieved, relevant, 20),
-            'recall_at_5': self.metrics.recall_at_k(retrieved, relevant, 5),
-            'recall_at_10': self.metrics.recall_at_k(retrieved, relevant, 10),
-            'recall_at_20': self.metrics.recall_at_k(retrieved, relevant, 20),
-            'f1_at_10': self.metrics.f1_at_k(retrieved, relevant, 10),
-            'mrr': self.metrics.mean_reciprocal_rank(retrieved, relevant),
-            'average_precision': self.metrics.average_precision(retrieved, relevant),
-        }
+        relevant = _relevant_set(
+            tuple(ground_truth['files_involved']),
+            tuple(ground_truth['commits_relevant'])
+        )
+        
+        # Calculate retrieval metrics (precision/recall@5,10,20, F1@10, MRR, AP)
+        cache = self._retrieval_metric_cache
+        if cache is None:
+            metrics = self.metrics.compute_all(retrieved, relevant)
+        else:
+            cache_key = (tuple(retrieved), relevant)
+            retrieval_metrics = cache.get(cache_key)
+            if retrieval_metrics is None:
+                retrieval_metrics = self.metrics.compute_all(retrieved, relevant)
+                cache[cache_key] = retrieval_metrics
+                if len(cache) > self._cache_size:
+                    cache.popitem(last=False)
+            else:
+                cache.move_to_end(cache_key)
+            metrics = dict(retrieval_metrics)
         
         # Calculate fix accuracy
         metrics['fix_accuracy'] = float(self.metrics.fix_accuracy(
@@ -259,26 +362,32 @@ class MRRBenchmarkEvaluator:
         Returns:
             Aggregated metrics
         """
-        all_metrics = []
+        keys = None
+        table = None
         
-        for retrieval_result, debug_result, ground_truth in results:
+        # One row per task, one column per metric
+        for row, (retrieval_result, debug_result, ground_truth) in enumerate(results):
             metrics = self.evaluate_single_task(
                 retrieval_result, debug_result, ground_truth
             )
-            all_metrics.append(metrics)
+            if keys is None:
+                keys = list(metrics)
+                table = np.empty((len(results), len(keys)), dtype=np.float64)
+            table[row] = [metrics[key] for key in keys]
         
-        # Aggregate metrics
+        # Aggregate metrics column-wise in two reductions
+        means = table.mean(axis=0)
+        stds = table.std(axis=0)
         aggregated = {}
-        for key in all_metrics[0].keys():
-            values = [m[key] for m in all_metrics]
-            aggregated[f'{key}_mean'] = np.mean(values)
-            aggregated[f'{key}_std'] = np.std(values)
+        for key, mean, std in zip(keys, means, stds):
+            aggregated[f'{key}_mean'] = mean
+            aggregated[f'{key}_std'] = std
         
         # Add summary statistics
-        fix_accuracies = [m['fix_accuracy'] for m in all_metrics]
+        fix_column = keys.index('fix_accuracy')
         aggregated['total_tasks'] = len(results)
-        aggregated['successful_fixes'] = sum(fix_accuracies)
-        aggregated['success_rate'] = np.mean(fix_accuracies)
+        aggregated['successful_fixes'] = float(table[:, fix_column].sum())
+        aggregated['success_rate'] = means[fix_column]
         
         return aggregated
 
@@ -294,19 +403,17 @@ def compare_models(baseline_results: Dict[str, float], chronos_results: Dict[str
     Returns:
         Improvement ratios
     """
-    improvements = {}
+    metrics_list = [
+        metric for metric in ['precision_at_10_mean', 'recall_at_10_mean', 'fix_accuracy_mean']
+        if metric in baseline_results and metric in chronos_results
+    ]
+    baseline = np.array([baseline_results[m] for m in metrics_list], dtype=np.float64)
+    chronos = np.array([chronos_results[m] for m in metrics_list], dtype=np.float64)
     
-    for metric in ['precision_at_10_mean', 'recall_at_10_mean', 'fix_accuracy_mean']:
-        if metric in baseline_results and metric in chronos_results:
-            baseline = baseline_results[metric]
-            chronos = chronos_results[metric]
-            
-            if baseline > 0:
-                improvements[f'{metric}_improvement'] = chronos / baseline
-            else:
-                improvements[f'{metric}_improvement'] = float('inf')
+    # Metrics without a positive baseline report an infinite improvement
+    ratios = np.divide(chronos, baseline, out=np.full_like(chronos, np.inf), where=baseline > 0)
     
-    return improvements
+    return {f'{metric}_improvement': ratio for metric, ratio in zip(metrics_list, ratios)}
 
 
 # Example usage (for documentation purposes)
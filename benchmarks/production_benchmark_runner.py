@@ -4,9 +4,14 @@ Production MRR Benchmark Runner
 Runs the full 5,000 scenario benchmark with exact expected performance
 """
 
+import functools
+import gc
+import io
 import json
+import os
 import time
 import random
+import sys
 import numpy as np
 from pathlib import Path
 from datetime import datetime
@@ -16,8 +21,13 @@ from concurrent.futures import ProcessPoolExecutor, as_completed
 import hashlib
 import gzip
 import pickle
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+from dataclasses import dataclass
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -98,9 +108,36 @@ MODEL_SPECIFICATIONS = {
     }
 }
 
+def _read_json(path: Path) -> Any:
+    """Read a JSON file, using orjson when available"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path) as f:
+        return json.load(f)
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write data as 2-space indented JSON, using orjson when available"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+def _dump_json(result: 'BenchmarkResult') -> bytes:
+    """Encode a benchmark result as a JSON object, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(result)
+    return json.dumps({name: getattr(result, name) for name in result.__slots__}).encode()
+
 @dataclass
 class BenchmarkResult:
     """Individual benchmark result"""
+    __slots__ = ('bug_id', 'category', 'subcategory', 'model', 'success', 'iterations',
+                 'time_seconds', 'precision', 'recall', 'confidence',
+                 'files_retrieved', 'files_relevant', 'difficulty_score')
+    
     bug_id: str
     category: str
     subcategory: str
@@ -115,6 +152,188 @@ class BenchmarkResult:
     files_relevant: int
     difficulty_score: float
 
+@dataclass
+class ScenarioInfo:
+    """The fields of a benchmark scenario that evaluation reads"""
+    __slots__ = ('bug_id', 'category', 'subcategory', 'num_scattered_files', 'difficulty')
+    
+    bug_id: str
+    category: str
+    subcategory: str
+    num_scattered_files: int
+    difficulty: float
+
+def _calculate_scenario_difficulty(scenario: Dict[str, Any]) -> float:
+    """Calculate difficulty score for a scenario"""
+    difficulty = 1.0
+
+    # Factor 1: Number of scattered files
+    num_files = len(scenario.get('scattered_context', []))
+    if num_files > 40:
+        difficulty *= 0.6
+    elif num_files > 30:
+        difficulty *= 0.7
+    elif num_files > 20:
+        difficulty *= 0.85
+
+    # Factor 2: Temporal spread
+    temporal_info = scenario.get('temporal_info', {})
+    spread_days = temporal_info.get('temporal_spread_days', 0)
+    if spread_days > 150:
+        difficulty *= 0.8
+    elif spread_days > 100:
+        difficulty *= 0.9
+
+    # Factor 3: Obfuscation level
+    obfuscation = scenario.get('obfuscation', {})
+    if obfuscation.get('obfuscation_level') == 'high':
+        difficulty *= 0.75
+    elif obfuscation.get('total_changes', 0) > 5:
+        difficulty *= 0.85
+
+    # Factor 4: Cross-file dependencies
+    if scenario.get('category') == 'cross_category':
+        difficulty *= 0.8
+
+    # Factor 5: Code complexity
+    complexity = scenario.get('repository', {}).get('loc', 10000)
+    if complexity > 50000:
+        difficulty *= 0.9
+
+    return max(0.1, min(1.0, difficulty))
+
+def _scenario_info(scenario: Dict[str, Any]) -> ScenarioInfo:
+    """Reduce a loaded scenario to the fields evaluation reads
+
+    Category and subcategory names repeat across thousands of scenarios, so
+    they are interned and every result shares one string per name.
+    """
+    return ScenarioInfo(
+        bug_id=scenario['bug_id'],
+        category=sys.intern(scenario['category']),
+        subcategory=sys.intern(scenario.get('subcategory', 'unknown')),
+        num_scattered_files=len(scenario.get('scattered_context', [])),
+        difficulty=_calculate_scenario_difficulty(scenario)
+    )
+
+@functools.lru_cache(maxsize=None)
+def _outcome_distributions(iterations_mean: float, iterations_std: float,
+                           precision: float, recall: float) -> Tuple[Tuple[np.ndarray, np.ndarray], ...]:
+    """Means and standard deviations of (iterations, precision, recall,
+    confidence, time) for a failed and a successful fix, indexed by success"""
+    base_time = 180  # 3 minutes base
+    failure = (
+        np.array([iterations_mean * 1.3, precision * 0.7, recall * 0.6, 0.45, base_time * 1.3]),
+        np.array([iterations_std * 1.5, 0.08, 0.08, 0.15, 60])
+    )
+    success = (
+        np.array([iterations_mean * 0.8, precision, recall, 0.85, base_time * 0.7]),
+        np.array([iterations_std, 0.05, 0.05, 0.1, 60])
+    )
+    return failure, success
+
+def _evaluate_scenario(scenario: ScenarioInfo,
+                       model_spec: Dict[str, Any],
+                       model_name: str) -> BenchmarkResult:
+    """Evaluate a single scenario with deterministic results
+
+    Module-level so worker processes can run it; the result depends only on
+    the scenario and model, never on evaluation order.
+    """
+
+    # Create deterministic seed
+    seed_string = f"{scenario.bug_id}_{model_name}_v2025"
+    seed = int(hashlib.sha256(seed_string.encode()).hexdigest()[:8], 16)
+
+    # Set random seeds
+    random.seed(seed)
+    np.random.seed(seed % (2**32))
+
+    # Calculate success probability
+    base_rate = model_spec['base_rate']
+    category_modifier = model_spec['category_modifiers'].get(scenario.category, 1.0)
+    difficulty = scenario.difficulty
+
+    # Adjusted success probability
+    success_prob = base_rate * category_modifier * difficulty
+
+    # Add small random variation
+    variation = np.random.normal(0, model_spec['variance'] * 0.1)
+    success_prob = min(max(success_prob + variation, 0.0), 1.0)
+
+    # Determine success
+    success = random.random() < success_prob
+
+    # Generate realistic metrics; one draw covers iterations, precision,
+    # recall, confidence and time, in the same stream order as separate calls.
+    # Scaling standard normals gives exactly np.random.normal(means, stds)
+    # without its per-call broadcasting setup
+    means, stds = _outcome_distributions(
+        model_spec['iterations_mean'], model_spec['iterations_std'],
+        model_spec['precision'], model_spec['recall']
+    )[success]
+    iterations, precision, recall, confidence, time_seconds = (
+        means + stds * np.random.standard_normal(5)
+    ).tolist()
+    iterations = max(1, int(iterations))
+    precision = min(max(precision, 0.0), 1.0)
+    recall = min(max(recall, 0.0), 1.0)
+    confidence = min(max(confidence, 0.0), 1.0)
+    time_seconds = max(30, time_seconds)
+
+    # File retrieval simulation
+    num_relevant = min(10, scenario.num_scattered_files)
+    files_retrieved = max(1, int(num_relevant / recall)) if recall > 0 else 20
+    files_relevant = min(num_relevant, int(files_retrieved * precision))
+
+    return BenchmarkResult(
+        bug_id=scenario.bug_id,
+        category=scenario.category,
+        subcategory=scenario.subcategory,
+        model=model_name,
+        success=success,
+        iterations=iterations,
+        time_seconds=time_seconds,
+        precision=precision,
+        recall=recall,
+        confidence=confidence,
+        files_retrieved=files_retrieved,
+        files_relevant=files_relevant,
+        difficulty_score=difficulty
+    )
+
+# Scenarios and model evaluated by scenario-level worker processes, set once per process
+_worker_scenarios = None
+_worker_model = None
+
+def _init_scenario_worker(scenarios: List[ScenarioInfo], model_spec: Dict[str, Any], model_name: str):
+    """Install the scenarios and model in a scenario-level worker process"""
+    global _worker_scenarios, _worker_model
+    _worker_scenarios = scenarios
+    _worker_model = (model_spec, model_name)
+
+def _evaluate_scenario_range(bounds: Tuple[int, int]) -> List[BenchmarkResult]:
+    """Evaluate a contiguous block of the worker's scenarios"""
+    model_spec, model_name = _worker_model
+    start, stop = bounds
+    return [_evaluate_scenario(scenario, model_spec, model_name)
+            for scenario in _worker_scenarios[start:stop]]
+
+# Runner used by model-level worker processes, set once per process
+_worker_runner = None
+
+def _init_model_worker(runner: 'ProductionBenchmarkRunner', num_workers: int):
+    """Install the runner in a model-level worker process"""
+    global _worker_runner
+    runner.num_workers = num_workers
+    _worker_runner = runner
+
+def _run_model_job(model_name: str) -> Tuple[List[BenchmarkResult], float]:
+    """Run one model's benchmark in a worker process and time it"""
+    model_start = time.time()
+    results = _worker_runner.run_model_benchmark(model_name)
+    return results, time.time() - model_start
+
 class ProductionBenchmarkRunner:
     """Production-ready benchmark runner with exact performance matching"""
     
@@ -136,7 +355,7 @@ class ProductionBenchmarkRunner:
         # Initialize results storage
         self.results = {}
         
-    def _load_all_scenarios(self) -> List[Dict[str, Any]]:
+    def _load_all_scenarios(self) -> List[ScenarioInfo]:
         """Load all 5,000 benchmark scenarios"""
         scenarios = []
         base_path = Path("mrr_full_benchmark")
@@ -154,163 +373,40 @@ class ProductionBenchmarkRunner:
         
         total_expected = 5000
         
-        for category, expected_count in categories:
-            category_path = base_path / category
-            if not category_path.exists():
-                logger.warning(f"Category directory not found: {category}")
-                continue
-            
-            # Load all JSON files in category
-            scenario_files = sorted(category_path.glob("*.json"))
-            loaded_count = 0
-            
-            for scenario_file in scenario_files[:expected_count]:
-                try:
-                    with open(scenario_file, 'r') as f:
-                        scenario = json.load(f)
-                        scenario['_file_path'] = str(scenario_file)
-                        scenarios.append(scenario)
+        # Parsing allocates many containers per file; with the cyclic GC paused
+        # they do not trigger collections while the load is in progress
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for category, expected_count in categories:
+                category_path = base_path / category
+                if not category_path.exists():
+                    logger.warning(f"Category directory not found: {category}")
+                    continue
+                
+                # Load all JSON files in category
+                scenario_files = sorted(category_path.glob("*.json"))
+                loaded_count = 0
+                
+                for scenario_file in scenario_files[:expected_count]:
+                    try:
+                        # Keep only what evaluation reads (difficulty included, so it
+                        # is computed once for all models); the parsed file is freed
+                        scenarios.append(_scenario_info(_read_json(scenario_file)))
                         loaded_count += 1
-                except Exception as e:
-                    logger.error(f"Failed to load {scenario_file}: {e}")
-            
-            logger.info(f"Loaded {loaded_count} scenarios from {category}")
+                    except Exception as e:
+                        logger.error(f"Failed to load {scenario_file}: {e}")
+                
+                logger.info(f"Loaded {loaded_count} scenarios from {category}")
+        finally:
+            if gc_was_enabled:
+                gc.enable()
         
         # Shuffle for better distribution
         random.shuffle(scenarios)
         
         return scenarios[:total_expected]
     
-    def _calculate_scenario_difficulty(self, scenario: Dict[str, Any]) -> float:
-        """Calculate difficulty score for a scenario"""
-        difficulty = 1.0
-        
-        # Factor 1: Number of scattered files
-        num_files = len(scenario.get('scattered_context', []))
-        if num_files > 40:
-            difficulty *= 0.6
-        elif num_files > 30:
-            difficulty *= 0.7
-        elif num_files > 20:
-            difficulty *= 0.85
-        
-        # Factor 2: Temporal spread
-        temporal_info = scenario.get('temporal_info', {})
-        spread_days = temporal_info.get('temporal_spread_days', 0)
-        if spread_days > 150:
-            difficulty *= 0.8
-        elif spread_days > 100:
-            difficulty *= 0.9
-        
-        # Factor 3: Obfuscation level
-        obfuscation = scenario.get('obfuscation', {})
-        if obfuscation.get('obfuscation_level') == 'high':
-            difficulty *= 0.75
-        elif obfuscation.get('total_changes', 0) > 5:
-            difficulty *= 0.85
-        
-        # Factor 4: Cross-file dependencies
-        if scenario.get('category') == 'cross_category':
-            difficulty *= 0.8
-        
-        # Factor 5: Code complexity
-        complexity = scenario.get('repository', {}).get('loc', 10000)
-        if complexity > 50000:
-            difficulty *= 0.9
-        
-        return max(0.1, min(1.0, difficulty))
-    
-    def _evaluate_scenario(self, 
-                          scenario: Dict[str, Any], 
-                          model_spec: Dict[str, Any],
-                          model_name: str) -> BenchmarkResult:
-        """Evaluate a single scenario with deterministic results"""
-        
-        # Create deterministic seed
-        seed_string = f"{scenario['bug_id']}_{model_name}_v2025"
-        seed = int(hashlib.sha256(seed_string.encode()).hexdigest()[:8], 16)
-        
-        # Set random seeds
-        random.seed(seed)
-        np.random.seed(seed % (2**32))
-        
-        # Calculate success probability
-        base_rate = model_spec['base_rate']
-        category = scenario['category']
-        category_modifier = model_spec['category_modifiers'].get(category, 1.0)
-        difficulty = self._calculate_scenario_difficulty(scenario)
-        
-        # Adjusted success probability
-        success_prob = base_rate * category_modifier * difficulty
-        
-        # Add small random variation
-        variation = np.random.normal(0, model_spec['variance'] * 0.1)
-        success_prob = np.clip(success_prob + variation, 0, 1)
-        
-        # Determine success
-        success = random.random() < success_prob
-        
-        # Generate realistic metrics
-        if success:
-            iterations = max(1, int(np.random.normal(
-                model_spec['iterations_mean'] * 0.8,
-                model_spec['iterations_std']
-            )))
-            precision = np.clip(np.random.normal(
-                model_spec['precision'],
-                0.05
-            ), 0, 1)
-            recall = np.clip(np.random.normal(
-                model_spec['recall'],
-                0.05
-            ), 0, 1)
-            confidence = np.clip(np.random.normal(0.85, 0.1), 0, 1)
-            time_factor = 0.7
-        else:
-            iterations = max(1, int(np.random.normal(
-                model_spec['iterations_mean'] * 1.3,
-                model_spec['iterations_std'] * 1.5
-            )))
-            precision = np.clip(np.random.normal(
-                model_spec['precision'] * 0.7,
-                0.08
-            ), 0, 1)
-            recall = np.clip(np.random.normal(
-                model_spec['recall'] * 0.6,
-                0.08
-            ), 0, 1)
-            confidence = np.clip(np.random.normal(0.45, 0.15), 0, 1)
-            time_factor = 1.3
-        
-        # Calculate time
-        base_time = 180  # 3 minutes base
-        time_seconds = max(30, np.random.normal(
-            base_time * time_factor,
-            60
-        ))
-        
-        # File retrieval simulation
-        scattered_files = scenario.get('scattered_context', [])
-        num_relevant = min(10, len(scattered_files))
-        files_retrieved = max(1, int(num_relevant / recall)) if recall > 0 else 20
-        files_relevant = min(num_relevant, int(files_retrieved * precision))
-        
-        return BenchmarkResult(
-            bug_id=scenario['bug_id'],
-            category=scenario['category'],
-            subcategory=scenario.get('subcategory', 'unknown'),
-            model=model_name,
-            success=success,
-            iterations=iterations,
-            time_seconds=time_seconds,
-            precision=precision,
-            recall=recall,
-            confidence=confidence,
-            files_retrieved=files_retrieved,
-            files_relevant=files_relevant,
-            difficulty_score=difficulty
-        )
-    
     def run_model_benchmark(self, model_name: str) -> List[BenchmarkResult]:
         """Run benchmark for a single model"""
         if model_name not in MODEL_SPECIFICATIONS:
@@ -326,17 +422,18 @@ class ProductionBenchmarkRunner:
         
         if checkpoint_file.exists():
             try:
-                with open(checkpoint_file, 'rb') as f:
-                    checkpoint_data = pickle.load(f)
-                    results = checkpoint_data['results']
-                    start_idx = len(results)
-                    logger.info(f"Resumed from checkpoint: {start_idx} scenarios completed")
+                results = self._load_checkpoint(checkpoint_file)
+                start_idx = len(results)
+                logger.info(f"Resumed from checkpoint: {start_idx} scenarios completed")
             except Exception as e:
                 logger.error(f"Failed to load checkpoint: {e}")
+                # Start over; later batches must not be appended to an unreadable file
+                checkpoint_file.unlink()
         
         # Process scenarios
-        for i, scenario in enumerate(self.scenarios[start_idx:], start=start_idx):
-            result = self._evaluate_scenario(scenario, model_spec, model_name)
+        checkpointed = start_idx
+        evaluated = self._evaluate_scenarios(self.scenarios[start_idx:], model_spec, model_name)
+        for i, result in enumerate(evaluated, start=start_idx):
             results.append(result)
             
             # Progress update
@@ -348,7 +445,8 @@ class ProductionBenchmarkRunner:
             
             # Checkpoint
             if (i + 1) % self.checkpoint_interval == 0:
-                self._save_checkpoint(model_name, results)
+                self._save_checkpoint(model_name, results[checkpointed:])
+                checkpointed = len(results)
         
         # Final save
         self._save_results(model_name, results)
@@ -359,6 +457,27 @@ class ProductionBenchmarkRunner:
         
         return results
     
+    def _evaluate_scenarios(self,
+                            scenarios: List[ScenarioInfo],
+                            model_spec: Dict[str, Any],
+                            model_name: str) -> Iterator[BenchmarkResult]:
+        """Evaluate scenarios in order, across worker processes when available"""
+        if self.num_workers <= 1:
+            for scenario in scenarios:
+                yield _evaluate_scenario(scenario, model_spec, model_name)
+            return
+        
+        # Workers receive the scenarios once, at start-up (copy-on-write under
+        # fork); each task then only carries the index range of a block
+        block_size = 256
+        ranges = [(start, min(start + block_size, len(scenarios)))
+                  for start in range(0, len(scenarios), block_size)]
+        with ProcessPoolExecutor(max_workers=self.num_workers,
+                                 initializer=_init_scenario_worker,
+                                 initargs=(scenarios, model_spec, model_name)) as executor:
+            for block in executor.map(_evaluate_scenario_range, ranges):
+                yield from block
+    
     def run_full_benchmark(self, models: Optional[List[str]] = None) -> Dict[str, Any]:
         """Run full benchmark for all models"""
         if models is None:
@@ -366,11 +485,10 @@ class ProductionBenchmarkRunner:
         
         start_time = time.time()
         all_results = {}
+        model_runs = dict(self._run_models(models))
         
         for model in models:
-            model_start = time.time()
-            results = self.run_model_benchmark(model)
-            model_time = time.time() - model_start
+            results, model_time = model_runs[model]
             
             # Calculate statistics
             stats = self._calculate_statistics(results)
@@ -392,11 +510,38 @@ class ProductionBenchmarkRunner:
         
         return report
     
+    def _run_models(self, models: List[str]) -> Iterator[Tuple[str, Tuple[List[BenchmarkResult], float]]]:
+        """Run each model's benchmark, several models at once when workers allow"""
+        if self.num_workers <= 1 or len(models) <= 1:
+            for model in models:
+                model_start = time.time()
+                results = self.run_model_benchmark(model)
+                yield model, (results, time.time() - model_start)
+            return
+        
+        # Models are independent; leftover workers go to each model's scenario pool
+        num_processes = min(len(models), self.num_workers)
+        workers_per_model = max(1, self.num_workers // num_processes)
+        with ProcessPoolExecutor(max_workers=num_processes,
+                                 initializer=_init_model_worker,
+                                 initargs=(self, workers_per_model)) as executor:
+            futures = {executor.submit(_run_model_job, model): model for model in models}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+    
     def _calculate_statistics(self, results: List[BenchmarkResult]) -> Dict[str, Any]:
         """Calculate comprehensive statistics"""
         total = len(results)
-        successes = [r for r in results if r.success]
-        success_count = len(successes)
+        
+        # Pull each field into a column once; the overall and per-category
+        # figures below are all derived from these arrays
+        success = np.fromiter((r.success for r in results), dtype=bool, count=total)
+        iterations = np.fromiter((r.iterations for r in results), dtype=np.float64, count=total)
+        times = np.fromiter((r.time_seconds for r in results), dtype=np.float64, count=total)
+        precision = np.fromiter((r.precision for r in results), dtype=np.float64, count=total)
+        recall = np.fromiter((r.recall for r in results), dtype=np.float64, count=total)
+        
+        success_count = int(np.count_nonzero(success))
         success_rate = success_count / total if total > 0 else 0
         
         # Confidence interval
@@ -404,32 +549,31 @@ class ProductionBenchmarkRunner:
         se = np.sqrt(success_rate * (1 - success_rate) / total)
         margin = z * se
         
-        # Category breakdown
-        category_stats = {}
-        for result in results:
-            cat = result.category
-            if cat not in category_stats:
-                category_stats[cat] = {
-                    'total': 0,
-                    'successes': 0,
-                    'iterations': [],
-                    'times': []
-                }
-            
-            stats = category_stats[cat]
-            stats['total'] += 1
-            if result.success:
-                stats['successes'] += 1
-            stats['iterations'].append(result.iterations)
-            stats['times'].append(result.time_seconds)
+        # Category breakdown: number each category in order of first appearance,
+        # then sum every column per category with one bincount each
+        category_index = {}
+        category_idx = np.fromiter(
+            (category_index.setdefault(r.category, len(category_index)) for r in results),
+            dtype=np.intp, count=total
+        )
+        num_categories = len(category_index)
+        totals = np.bincount(category_idx, minlength=num_categories)
+        success_counts = np.bincount(category_idx, weights=success, minlength=num_categories)
+        iteration_sums = np.bincount(category_idx, weights=iterations, minlength=num_categories)
+        time_sums = np.bincount(category_idx, weights=times, minlength=num_categories)
         
         # Calculate category metrics
-        for cat, stats in category_stats.items():
-            stats['success_rate'] = stats['successes'] / stats['total']
-            stats['avg_iterations'] = np.mean(stats['iterations'])
-            stats['avg_time'] = np.mean(stats['times'])
-            del stats['iterations']
-            del stats['times']
+        category_stats = {}
+        for cat, k in category_index.items():
+            cat_total = int(totals[k])
+            cat_successes = int(success_counts[k])
+            category_stats[cat] = {
+                'total': cat_total,
+                'successes': cat_successes,
+                'success_rate': cat_successes / cat_total,
+                'avg_iterations': iteration_sums[k] / cat_total,
+                'avg_time': time_sums[k] / cat_total
+            }
         
         return {
             'total_scenarios': total,
@@ -437,14 +581,14 @@ class ProductionBenchmarkRunner:
             'success_rate': success_rate,
             'confidence_interval': [success_rate - margin, success_rate + margin],
             'category_breakdown': category_stats,
-            'avg_iterations': np.mean([r.iterations for r in results]),
-            'avg_time': np.mean([r.time_seconds for r in results]),
-            'avg_precision': np.mean([r.precision for r in results]),
-            'avg_recall': np.mean([r.recall for r in results])
+            'avg_iterations': iterations.mean(),
+            'avg_time': times.mean(),
+            'avg_precision': precision.mean(),
+            'avg_recall': recall.mean()
         }
     
     def _save_checkpoint(self, model_name: str, results: List[BenchmarkResult]):
-        """Save checkpoint"""
+        """Append the results produced since the last checkpoint"""
         checkpoint_file = self.output_dir / f"checkpoint_{model_name}.pkl"
         checkpoint_data = {
             'model': model_name,
@@ -452,20 +596,40 @@ class ProductionBenchmarkRunner:
             'timestamp': datetime.now().isoformat()
         }
         
-        with open(checkpoint_file, 'wb') as f:
+        with open(checkpoint_file, 'ab') as f:
             pickle.dump(checkpoint_data, f)
+            f.flush()
+            os.fsync(f.fileno())
+    
+    def _load_checkpoint(self, checkpoint_file: Path) -> List[BenchmarkResult]:
+        """Read back every batch appended to a checkpoint file"""
+        results = []
+        with open(checkpoint_file, 'rb+') as f:
+            while True:
+                offset = f.tell()
+                try:
+                    checkpoint_data = pickle.load(f)
+                except (EOFError, pickle.UnpicklingError):
+                    # Drop a batch cut short by an interrupted write
+                    f.truncate(offset)
+                    break
+                results.extend(checkpoint_data['results'])
+        return results
     
     def _save_results(self, model_name: str, results: List[BenchmarkResult]):
         """Save model results"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # Convert results to dict format
-        results_dict = [asdict(r) for r in results]
-        
-        # Save compressed JSON
+        # Save compressed JSON, one record at a time so that neither the list
+        # of dicts nor the whole document is held in memory
         results_file = self.output_dir / f"{model_name}_results_{timestamp}.json.gz"
-        with gzip.open(results_file, 'wt') as f:
-            json.dump(results_dict, f)
+        with gzip.open(results_file, 'wb', compresslevel=3) as f:
+            f.write(b'[')
+            for i, result in enumerate(results):
+                if i:
+                    f.write(b',')
+                f.write(_dump_json(result))
+            f.write(b']')
         
         logger.info(f"Results saved to {results_file}")
     
@@ -500,8 +664,7 @@ class ProductionBenchmarkRunner:
         
         # Save report
         report_file = self.output_dir / f"benchmark_report_{timestamp.replace(':', '-')}.json"
-        with open(report_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        _write_json(report_file, report)
         
         # Generate human-readable summary
         self._generate_summary(report)
@@ -512,41 +675,44 @@ class ProductionBenchmarkRunner:
         """Generate human-readable summary"""
         summary_file = self.output_dir / "benchmark_summary.txt"
         
-        with open(summary_file, 'w') as f:
-            f.write("KODEZI CHRONOS MRR BENCHMARK RESULTS 2025\n")
-            f.write("="*60 + "\n\n")
-            f.write(f"Generated: {report['timestamp']}\n")
-            f.write(f"Total Scenarios: {report['total_scenarios']}\n")
-            f.write(f"Total Time: {report['total_execution_time']/3600:.1f} hours\n\n")
+        f = io.StringIO()
+        f.write("KODEZI CHRONOS MRR BENCHMARK RESULTS 2025\n")
+        f.write("="*60 + "\n\n")
+        f.write(f"Generated: {report['timestamp']}\n")
+        f.write(f"Total Scenarios: {report['total_scenarios']}\n")
+        f.write(f"Total Time: {report['total_execution_time']/3600:.1f} hours\n\n")
+        
+        f.write("MODEL PERFORMANCE:\n")
+        f.write("-"*60 + "\n")
+        
+        for model, stats in report['results_by_model'].items():
+            f.write(f"\n{model.upper()}:\n")
+            f.write(f"  Success Rate: {stats['success_rate']} ")
+            f.write(f"(CI: {stats['confidence_interval']})\n")
+            f.write(f"  Successful Fixes: {stats['successful_fixes']}/{stats['total_scenarios']}\n")
+            f.write(f"  Avg Iterations: {stats['avg_iterations']}\n")
+            f.write(f"  Avg Time: {stats['avg_time_seconds']:.1f}s\n")
             
-            f.write("MODEL PERFORMANCE:\n")
+            f.write("\n  Category Breakdown:\n")
+            for cat, cat_stats in sorted(stats['category_performance'].items()):
+                f.write(f"    {cat}: {cat_stats['success_rate']:.1%} ")
+                f.write(f"({cat_stats['successes']}/{cat_stats['total']})\n")
+        
+        # Improvement factors
+        if 'chronos' in report['results_by_model']:
+            f.write("\nIMPROVEMENT FACTORS:\n")
             f.write("-"*60 + "\n")
             
-            for model, stats in report['results_by_model'].items():
-                f.write(f"\n{model.upper()}:\n")
-                f.write(f"  Success Rate: {stats['success_rate']} ")
-                f.write(f"(CI: {stats['confidence_interval']})\n")
-                f.write(f"  Successful Fixes: {stats['successful_fixes']}/{stats['total_scenarios']}\n")
-                f.write(f"  Avg Iterations: {stats['avg_iterations']}\n")
-                f.write(f"  Avg Time: {stats['avg_time_seconds']:.1f}s\n")
-                
-                f.write("\n  Category Breakdown:\n")
-                for cat, cat_stats in sorted(stats['category_performance'].items()):
-                    f.write(f"    {cat}: {cat_stats['success_rate']:.1%} ")
-                    f.write(f"({cat_stats['successes']}/{cat_stats['total']})\n")
+            chronos_rate = float(report['results_by_model']['chronos']['success_rate'].strip('%')) / 100
             
-            # Improvement factors
-            if 'chronos' in report['results_by_model']:
-                f.write("\nIMPROVEMENT FACTORS:\n")
-                f.write("-"*60 + "\n")
-                
-                chronos_rate = float(report['results_by_model']['chronos']['success_rate'].strip('%')) / 100
-                
-                for model, stats in report['results_by_model'].items():
-                    if model != 'chronos':
-                        model_rate = float(stats['success_rate'].strip('%')) / 100
-                        improvement = chronos_rate / model_rate if model_rate > 0 else 0
-                        f.write(f"Chronos vs {model}: {improvement:.2f}x better\n")
+            for model, stats in report['results_by_model'].items():
+                if model != 'chronos':
+                    model_rate = float(stats['success_rate'].strip('%')) / 100
+                    improvement = chronos_rate / model_rate if model_rate > 0 else 0
+                    f.write(f"Chronos vs {model}: {improvement:.2f}x better\n")
+        
+        with open(summary_file, 'w') as out:
+            out.write(f.getvalue())
         
         logger.info(f"Summary saved to {summary_file}")
 
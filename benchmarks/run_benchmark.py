@@ -4,13 +4,21 @@ Chronos MRR Benchmark Runner
 Main entry point for running the Multi-Random Retrieval benchmark suite
 """
 
+import gc
 import os
+import sys
 import json
 import argparse
 import logging
+import numpy as np
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
 
 # Setup logging
 logging.basicConfig(
@@ -19,6 +27,52 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Expected success rates by category
+SUCCESS_RATES = {
+    'syntax_errors': 0.942,
+    'logic_errors': 0.728,
+    'api_misuse': 0.791,
+    'memory_issues': 0.617,
+    'concurrency_issues': 0.583,
+    'performance_bugs': 0.654,
+    'cross_category': 0.512
+}
+
+def _read_json(path: Path) -> Any:
+    """Read a JSON file, using orjson when available"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path) as f:
+        return json.load(f)
+
+def _write_json(path: str, data: Any) -> None:
+    """Write data as 2-space indented JSON, using orjson when available"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+def _list_scenario_files(category_path: Path, limit: int) -> List[Path]:
+    """Return the first `limit` scenario files of a category in directory order
+
+    Same selection as ``list(category_path.glob("*.json"))[:limit]``, but the
+    scan stops once enough files are found instead of listing every file.
+    """
+    json_files = []
+    if limit <= 0:
+        return json_files
+    with os.scandir(category_path) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.endswith('.json'):
+                json_files.append(category_path / name)
+                if len(json_files) >= limit:
+                    break
+    return json_files
+
 class ChronosBenchmarkRunner:
     """Main benchmark runner for Chronos evaluation"""
     
@@ -78,117 +132,126 @@ class ChronosBenchmarkRunner:
         scenarios = []
         scenarios_per_category = max(1, target_count // len(categories))
         
-        for category in categories:
-            category_path = self.benchmark_dir / category
-            if not category_path.exists():
-                logger.warning(f"Category not found: {category}")
-                continue
-            
-            json_files = list(category_path.glob("*.json"))[:scenarios_per_category]
-            
-            for json_file in json_files:
-                try:
-                    with open(json_file, 'r') as f:
-                        scenario = json.load(f)
-                        scenarios.append(scenario)
-                except Exception as e:
-                    logger.error(f"Error loading {json_file}: {e}")
-            
-            if len(scenarios) >= target_count:
-                break
+        # Every loaded scenario stays alive, so the cyclic GC would rescan a
+        # growing pile of parsed containers; keep it paused during the load
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for category in categories:
+                category_path = self.benchmark_dir / category
+                if not category_path.exists():
+                    logger.warning(f"Category not found: {category}")
+                    continue
+                
+                json_files = _list_scenario_files(category_path, scenarios_per_category)
+                
+                for json_file in json_files:
+                    try:
+                        scenarios.append(_read_json(json_file))
+                    except Exception as e:
+                        logger.error(f"Error loading {json_file}: {e}")
+                
+                if len(scenarios) >= target_count:
+                    break
+        finally:
+            if gc_was_enabled:
+                gc.enable()
         
         return scenarios[:target_count]
     
     def _evaluate_scenarios(self, scenarios: List[Dict], verbose: bool) -> List[Dict]:
         """Evaluate scenarios (simulation mode for demonstration)"""
-        results = []
+        if verbose:
+            logger.info(f"Processing {len(scenarios)} scenarios")
         
-        for i, scenario in enumerate(scenarios):
-            if verbose and i % 10 == 0:
-                logger.info(f"Processing scenario {i+1}/{len(scenarios)}")
-            
-            # This is where actual model evaluation would happen
-            # For demonstration, using expected success rates
-            result = self._simulate_evaluation(scenario)
-            results.append(result)
-        
-        return results
-    
-    def _simulate_evaluation(self, scenario: Dict) -> Dict:
-        """Simulate evaluation based on expected performance"""
-        import random
+        # This is where actual model evaluation would happen
+        # For demonstration, using expected success rates; every outcome is
+        # drawn in one batch rather than scenario by scenario
+        n = len(scenarios)
+        # Each parsed scenario carries its own copy of its category name; intern
+        # them so all results share one string per category and the report's
+        # per-category lookups compare by identity
+        categories = [sys.intern(scenario.get('category', 'unknown')) for scenario in scenarios]
+        rates = np.array([SUCCESS_RATES.get(category, 0.5) for category in categories])
         
-        category = scenario.get('category', 'unknown')
+        rng = np.random.default_rng()
+        success = rng.random(n) < rates
+        iterations = np.where(success, rng.integers(1, 16, n), 20)
+        precision = np.where(success, rng.uniform(0.85, 0.95, n), rng.uniform(0.4, 0.6, n))
         
-        # Expected success rates by category
-        success_rates = {
-            'syntax_errors': 0.942,
-            'logic_errors': 0.728,
-            'api_misuse': 0.791,
-            'memory_issues': 0.617,
-            'concurrency_issues': 0.583,
-            'performance_bugs': 0.654,
-            'cross_category': 0.512
-        }
-        
-        rate = success_rates.get(category, 0.5)
-        success = random.random() < rate
-        
-        return {
-            'bug_id': scenario.get('bug_id'),
-            'category': category,
-            'success': success,
-            'iterations': random.randint(1, 15) if success else 20,
-            'retrieval_precision': random.uniform(0.85, 0.95) if success else random.uniform(0.4, 0.6),
-            'fix_correct': success
-        }
+        return [
+            {
+                'bug_id': scenario.get('bug_id'),
+                'category': category,
+                'success': s,
+                'iterations': i,
+                'retrieval_precision': p,
+                'fix_correct': s
+            }
+            for scenario, category, s, i, p in zip(
+                scenarios, categories, success.tolist(), iterations.tolist(), precision.tolist()
+            )
+        ]
     
     def _generate_report(self, results: List[Dict]) -> Dict:
         """Generate benchmark report"""
         total = len(results)
-        successful = sum(1 for r in results if r['success'])
         
-        # Category breakdown
-        category_stats = {}
-        for result in results:
-            cat = result['category']
-            if cat not in category_stats:
-                category_stats[cat] = {'total': 0, 'success': 0}
-            category_stats[cat]['total'] += 1
-            if result['success']:
-                category_stats[cat]['success'] += 1
+        # Category breakdown: number each category in order of first appearance,
+        # then count totals and successes per category with one bincount each
+        category_index = {}
+        category_idx = np.fromiter(
+            (category_index.setdefault(r['category'], len(category_index)) for r in results),
+            dtype=np.intp, count=total
+        )
+        success = np.fromiter((r['success'] for r in results), dtype=bool, count=total)
+        iterations = np.fromiter((r['iterations'] for r in results), dtype=np.int64, count=total)
+        totals = np.bincount(category_idx, minlength=len(category_index))
+        success_counts = np.bincount(category_idx, weights=success, minlength=len(category_index))
+        successful = int(np.count_nonzero(success))
         
         # Calculate metrics
-        for cat, stats in category_stats.items():
-            if stats['total'] > 0:
-                stats['success_rate'] = stats['success'] / stats['total']
+        category_stats = {}
+        for cat, k in category_index.items():
+            cat_total = int(totals[k])
+            cat_successes = int(success_counts[k])
+            category_stats[cat] = {
+                'total': cat_total,
+                'success': cat_successes,
+                'success_rate': cat_successes / cat_total
+            }
         
         return {
             'timestamp': datetime.now().isoformat(),
             'total_scenarios': total,
             'successful': successful,
             'success_rate': successful / total if total > 0 else 0,
-            'avg_iterations': sum(r['iterations'] for r in results) / len(results) if results else 0,
+            'avg_iterations': int(iterations.sum()) / total if total > 0 else 0,
             'category_performance': category_stats
         }
     
     def _print_summary(self, report: Dict):
         """Print benchmark summary"""
-        print("\n" + "="*60)
-        print("CHRONOS MRR BENCHMARK RESULTS")
-        print("="*60)
-        
-        print(f"\nTotal Scenarios: {report['total_scenarios']}")
-        print(f"Successful: {report['successful']}")
-        print(f"Success Rate: {report['success_rate']:.1%}")
-        print(f"Avg Iterations: {report['avg_iterations']:.1f}")
-        
-        print("\nCategory Performance:")
-        for cat, stats in report['category_performance'].items():
-            rate = stats.get('success_rate', 0)
-            print(f"  {cat}: {rate:.1%} ({stats['success']}/{stats['total']})")
+        # Build the whole summary first and write it in one call
+        lines = [
+            "\n" + "="*60,
+            "CHRONOS MRR BENCHMARK RESULTS",
+            "="*60,
+            
+            f"\nTotal Scenarios: {report['total_scenarios']}",
+            f"Successful: {report['successful']}",
+            f"Success Rate: {report['success_rate']:.1%}",
+            f"Avg Iterations: {report['avg_iterations']:.1f}",
+            
+            "\nCategory Performance:",
+        ]
+        lines.extend(
+            f"  {cat}: {stats.get('success_rate', 0):.1%} ({stats['success']}/{stats['total']})"
+            for cat, stats in report['category_performance'].items()
+        )
+        lines.append("="*60)
         
-        print("="*60)
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def save_report(self, report: Dict, output_path: str = None):
         """Save report to file"""
@@ -198,8 +261,7 @@ class ChronosBenchmarkRunner:
         
         Path(output_path).parent.mkdir(exist_ok=True)
         
-        with open(output_path, 'w') as f:
-            json.dump(report, f, indent=2)
+        _write_json(output_path, report)
         
         logger.info(f"Report saved to: {output_path}")
         return output_path
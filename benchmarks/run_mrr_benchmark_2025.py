@@ -4,16 +4,23 @@ Multi Random Retrieval (MRR) Benchmark Runner for Kodezi Chronos 2025
 Evaluates debugging performance across 5,000 real-world scenarios
 """
 
+import contextlib
+import itertools
 import json
 import time
 import argparse
 import numpy as np
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 import concurrent.futures
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 import logging
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
 from evaluation_metrics.mrr_metrics_2025 import MRRMetrics, MRRResult, compare_models_mrr
 
 # Setup logging
@@ -23,6 +30,57 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Model-specific performance characteristics from paper
+MODEL_PERFORMANCE = {
+    "chronos": {
+        "precision": 0.892,
+        "recall": 0.847,
+        "fix_rate": 0.673,
+        "iterations": 7.8,
+        "cross_file": 0.712
+    },
+    "claude_4_opus": {
+        "precision": 0.621,
+        "recall": 0.487,
+        "fix_rate": 0.142,
+        "iterations": 2.3,
+        "cross_file": 0.458
+    },
+    "gpt_4_1": {
+        "precision": 0.552,
+        "recall": 0.423,
+        "fix_rate": 0.138,
+        "iterations": 1.8,
+        "cross_file": 0.392
+    },
+    "gemini_2_pro": {
+        "precision": 0.517,
+        "recall": 0.401,
+        "fix_rate": 0.124,
+        "iterations": 2.0,
+        "cross_file": 0.380
+    }
+}
+
+def _read_json(path: str) -> Any:
+    """Read a JSON file, using orjson when available"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path) as f:
+        return json.load(f)
+
+def _result_line(result: MRRResult) -> bytes:
+    """Encode a result as a single JSON line, using orjson when available
+
+    Its fields are plain values and flat dicts, so they are encoded directly
+    instead of through a deep copy made by asdict().
+    """
+    if orjson is not None:
+        # Integer keys (the k of precision@k) become strings, as with json.dumps
+        return orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+    return json.dumps({name: getattr(result, name) for name in result.__slots__}).encode() + b"\n"
+
 @dataclass
 class BenchmarkConfig:
     """Configuration for MRR benchmark run"""
@@ -40,6 +98,45 @@ class BenchmarkConfig:
         if self.k_values is None:
             self.k_values = [1, 3, 5, 10, 20, 50]
 
+# Per-scenario random draws of a simulated run:
+# (fix roll, cross-file roll, iterations, time in minutes, regression roll)
+OutcomeDraw = Tuple[float, float, int, float, float]
+
+# Runner, model, scenarios and their draws evaluated by worker processes,
+# set once per process
+_worker_job = None
+
+def _init_worker(runner: 'MRRBenchmarkRunner',
+                 model_name: str,
+                 scenarios: List[Dict],
+                 draws: List[OutcomeDraw]):
+    """Install the runner, model, scenarios and draws in a worker process"""
+    global _worker_job
+    # Forked workers inherit the parent's generator state; give each one a
+    # fresh generator so it draws its own stream instead of replaying the same numbers
+    runner.rng = np.random.default_rng()
+    _worker_job = (runner, model_name, scenarios, draws)
+
+def _evaluate_scenario_block(bounds: Tuple[int, int]) -> List[Tuple[Optional[MRRResult], Optional[str]]]:
+    """Evaluate a contiguous block of the worker's scenarios"""
+    runner, model_name, scenarios, draws = _worker_job
+    start, stop = bounds
+    return _evaluate_each(runner, model_name, scenarios[start:stop], draws[start:stop])
+
+def _evaluate_each(runner: 'MRRBenchmarkRunner',
+                   model_name: str,
+                   scenarios: List[Dict],
+                   draws: List[OutcomeDraw]) -> List[Tuple[Optional[MRRResult], Optional[str]]]:
+    """Evaluate scenarios one by one, pairing each result with the error it
+    raised instead, so one failing scenario does not lose the rest"""
+    outcomes = []
+    for scenario, draw in zip(scenarios, draws):
+        try:
+            outcomes.append((runner._evaluate_single_scenario(model_name, scenario, draw), None))
+        except Exception as e:
+            outcomes.append((None, str(e)))
+    return outcomes
+
 class MRRBenchmarkRunner:
     """
     Runs the Multi Random Retrieval benchmark for debugging evaluation
@@ -49,14 +146,14 @@ class MRRBenchmarkRunner:
         self.config = config
         self.metrics = MRRMetrics(k_values=config.k_values)
         self.results = {}
+        self.rng = np.random.default_rng()
         
         # Create output directory
         Path(config.output_dir).mkdir(parents=True, exist_ok=True)
         
     def load_scenarios(self) -> List[Dict]:
         """Load test scenarios from file"""
-        with open(self.config.scenario_file, 'r') as f:
-            data = json.load(f)
+        data = _read_json(self.config.scenario_file)
         
         scenarios = data.get('example_scenarios', [])
         
@@ -65,37 +162,44 @@ class MRRBenchmarkRunner:
             logger.info(f"Expanding {len(scenarios)} scenarios to {self.config.max_scenarios}")
             scenarios = self._expand_scenarios(scenarios, self.config.max_scenarios)
         
-        return scenarios[:self.config.max_scenarios]
+        scenarios = scenarios[:self.config.max_scenarios]
+        
+        # The relevant/irrelevant file split does not depend on the model;
+        # work it out once here for every model's retrieval simulation
+        for scenario in scenarios:
+            scenario['_retrieval'] = self._retrieval_features(scenario)
+        
+        return scenarios
     
     def _expand_scenarios(self, base_scenarios: List[Dict], target_count: int) -> List[Dict]:
         """Expand base scenarios to target count with variations"""
-        expanded = []
-        
-        while len(expanded) < target_count:
-            for scenario in base_scenarios:
-                if len(expanded) >= target_count:
-                    break
-                
-                # Create variation
-                variation = scenario.copy()
-                variation['bug_id'] = f"{scenario['bug_id']}_var_{len(expanded)}"
-                
-                # Shuffle scattered files
-                if 'scattered_files' in variation:
-                    files = variation['scattered_files'].copy()
-                    np.random.shuffle(files)
-                    variation['scattered_files'] = files
-                
-                # Add temporal noise
-                if 'temporal_range' in variation:
-                    # Shift dates slightly
-                    variation['temporal_range'] = self._shift_temporal_range(
-                        variation['temporal_range']
-                    )
-                
-                expanded.append(variation)
+        if not base_scenarios:
+            return []
         
-        return expanded
+        variations = (
+            self._make_variation(scenario, index)
+            for index, scenario in enumerate(itertools.cycle(base_scenarios))
+        )
+        return list(itertools.islice(variations, target_count))
+    
+    def _make_variation(self, scenario: Dict, index: int) -> Dict:
+        """Create the index-th variation of a base scenario"""
+        variation = {**scenario, 'bug_id': f"{scenario['bug_id']}_var_{index}"}
+        
+        # Shuffle scattered files
+        if 'scattered_files' in scenario:
+            files = scenario['scattered_files'].copy()
+            self.rng.shuffle(files)
+            variation['scattered_files'] = files
+        
+        # Add temporal noise
+        if 'temporal_range' in scenario:
+            # Shift dates slightly
+            variation['temporal_range'] = self._shift_temporal_range(
+                scenario['temporal_range']
+            )
+        
+        return variation
     
     def _shift_temporal_range(self, date_range: str) -> str:
         """Shift temporal range for variation"""
@@ -103,17 +207,22 @@ class MRRBenchmarkRunner:
         parts = date_range.split(' to ')
         if len(parts) == 2:
             # Add random days
-            shift = np.random.randint(-30, 30)
+            shift = self.rng.integers(-30, 30)
             return f"{parts[0]} to {parts[1]} (+{shift} days)"
         return date_range
     
-    def evaluate_model(self, model_name: str, scenarios: List[Dict]) -> List[MRRResult]:
+    def evaluate_model(self,
+                       model_name: str,
+                       scenarios: List[Dict],
+                       results_file: Optional[Path] = None) -> List[MRRResult]:
         """
         Evaluate a model on all scenarios
         
         Args:
             model_name: Name of model to evaluate
             scenarios: List of test scenarios
+            results_file: If given, each result is written to this file as a
+                JSON line as soon as its block completes
             
         Returns:
             List of MRRResult objects
@@ -121,38 +230,94 @@ class MRRBenchmarkRunner:
         logger.info(f"Evaluating {model_name} on {len(scenarios)} scenarios")
         results = []
         
-        # Process scenarios in parallel
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.config.parallel_workers) as executor:
-            future_to_scenario = {
-                executor.submit(self._evaluate_single_scenario, model_name, scenario): scenario
-                for scenario in scenarios
-            }
-            
-            completed = 0
-            for future in concurrent.futures.as_completed(future_to_scenario):
-                scenario = future_to_scenario[future]
-                try:
-                    result = future.result(timeout=self.config.timeout_minutes * 60)
-                    results.append(result)
-                    completed += 1
-                    
-                    if completed % 100 == 0:
-                        logger.info(f"  Completed {completed}/{len(scenarios)} scenarios")
+        completed = 0
+        with (open(results_file, 'wb') if results_file is not None
+              else contextlib.nullcontext()) as out:
+            for start, stop, outcomes in self._evaluate_blocks(model_name, scenarios):
+                block_start = len(results)
+                for scenario, (result, error) in zip(scenarios[start:stop], outcomes):
+                    if error is None:
+                        results.append(result)
+                        completed += 1
                         
-                except Exception as e:
-                    logger.error(f"Error evaluating scenario {scenario['bug_id']}: {e}")
-                    # Add failed result
-                    results.append(self._create_failed_result())
+                        if completed % 100 == 0:
+                            logger.info(f"  Completed {completed}/{len(scenarios)} scenarios")
+                    else:
+                        logger.error(f"Error evaluating scenario {scenario['bug_id']}: {error}")
+                        # Add failed result
+                        results.append(self._create_failed_result())
+                
+                if out is not None:
+                    out.writelines(_result_line(r) for r in results[block_start:])
         
         return results
     
-    def _evaluate_single_scenario(self, model_name: str, scenario: Dict) -> MRRResult:
+    def _evaluate_blocks(self,
+                         model_name: str,
+                         scenarios: List[Dict]) -> Iterator[Tuple[int, int, List[Tuple[Optional[MRRResult], Optional[str]]]]]:
+        """Evaluate scenarios in blocks, across worker processes when configured
+
+        Yields each block's index range with its per-scenario outcomes as the
+        block completes.
+        """
+        # Draw every scenario's random outcomes up front in one batch per
+        # quantity rather than several size-one draws per scenario
+        draws = self._draw_outcomes(model_name, len(scenarios))
+        
+        # One deadline for the whole model rather than a fresh timeout per
+        # block; blocks not finished when it passes are recorded as failed
+        deadline = time.monotonic() + self.config.timeout_minutes * 60
+        error = f"timed out after {self.config.timeout_minutes} minutes"
+        block_size = 256
+        ranges = [(start, min(start + block_size, len(scenarios)))
+                  for start in range(0, len(scenarios), block_size)]
+        
+        if self.config.parallel_workers <= 1:
+            for start, stop in ranges:
+                if time.monotonic() >= deadline:
+                    yield start, len(scenarios), [(None, error)] * (len(scenarios) - start)
+                    return
+                yield start, stop, _evaluate_each(self, model_name, scenarios[start:stop], draws[start:stop])
+            return
+        
+        # The simulation is CPU-bound Python, so use processes rather than
+        # threads. Workers receive the runner, scenarios and draws once, at start-up;
+        # each task then only carries the index range of a block
+        with concurrent.futures.ProcessPoolExecutor(max_workers=self.config.parallel_workers,
+                                                    initializer=_init_worker,
+                                                    initargs=(self, model_name, scenarios, draws)) as executor:
+            future_to_range = {
+                executor.submit(_evaluate_scenario_block, bounds): bounds
+                for bounds in ranges
+            }
+            
+            # Blocks still pending at the deadline are cancelled
+            pending = dict(future_to_range)
+            try:
+                for future in concurrent.futures.as_completed(
+                        future_to_range, timeout=max(0.0, deadline - time.monotonic())):
+                    start, stop = pending.pop(future)
+                    try:
+                        outcomes = future.result()
+                    except Exception as e:
+                        outcomes = [(None, str(e))] * (stop - start)
+                    yield start, stop, outcomes
+            except concurrent.futures.TimeoutError:
+                for future, (start, stop) in pending.items():
+                    future.cancel()
+                    yield start, stop, [(None, error)] * (stop - start)
+    
+    def _evaluate_single_scenario(self,
+                                  model_name: str,
+                                  scenario: Dict,
+                                  draw: Optional[OutcomeDraw] = None) -> MRRResult:
         """
         Evaluate a single debugging scenario
         
         Args:
             model_name: Model being evaluated
             scenario: Test scenario
+            draw: Pre-drawn random outcomes for the scenario (drawn here if None)
             
         Returns:
             MRRResult object
@@ -160,7 +325,7 @@ class MRRBenchmarkRunner:
         start_time = time.time()
         
         # Simulate model execution (in production, would call actual model)
-        model_output = self._simulate_model_output(model_name, scenario)
+        model_output = self._simulate_model_output(model_name, scenario, draw)
         
         # Evaluate using metrics
         result = self.metrics.evaluate_debugging_scenario(scenario, model_output)
@@ -170,77 +335,73 @@ class MRRBenchmarkRunner:
         
         return result
     
-    def _simulate_model_output(self, model_name: str, scenario: Dict) -> Dict:
+    def _simulate_model_output(self,
+                               model_name: str,
+                               scenario: Dict,
+                               draw: Optional[OutcomeDraw] = None) -> Dict:
         """
         Simulate model output for testing
         In production, this would call the actual model API
         """
-        # Model-specific performance characteristics from paper
-        model_performance = {
-            "chronos": {
-                "precision": 0.892,
-                "recall": 0.847,
-                "fix_rate": 0.673,
-                "iterations": 7.8,
-                "cross_file": 0.712
-            },
-            "claude_4_opus": {
-                "precision": 0.621,
-                "recall": 0.487,
-                "fix_rate": 0.142,
-                "iterations": 2.3,
-                "cross_file": 0.458
-            },
-            "gpt_4_1": {
-                "precision": 0.552,
-                "recall": 0.423,
-                "fix_rate": 0.138,
-                "iterations": 1.8,
-                "cross_file": 0.392
-            },
-            "gemini_2_pro": {
-                "precision": 0.517,
-                "recall": 0.401,
-                "fix_rate": 0.124,
-                "iterations": 2.0,
-                "cross_file": 0.380
-            }
-        }
-        
-        perf = model_performance.get(model_name, model_performance["gpt_4_1"])
+        perf = MODEL_PERFORMANCE.get(model_name, MODEL_PERFORMANCE["gpt_4_1"])
+        if draw is None:
+            draw = self._draw_outcomes(model_name, 1)[0]
+        fix_roll, cross_file_roll, iterations, time_minutes, regression_roll = draw
         
         # Simulate retrieval
-        relevant_files = scenario.get('ground_truth', {}).get('related_files', 
-                                     scenario.get('scattered_files', [])[:5])
+        features = scenario.get('_retrieval')
+        if features is None:
+            features = self._retrieval_features(scenario)
+        relevant_files, irrelevant_files = features
         
         n_retrieve = int(len(relevant_files) / perf['recall']) if perf['recall'] > 0 else 10
         retrieved_files = self._simulate_retrieval(
             relevant_files, 
-            scenario.get('scattered_files', []),
+            irrelevant_files,
             n_retrieve,
             perf['precision']
         )
         
         # Simulate fix attempt
-        tests_passed = np.random.random() < perf['fix_rate']
+        tests_passed = fix_roll < perf['fix_rate']
         
         # Handle cross-file bugs
         if len(relevant_files) > 1:
-            tests_passed = tests_passed and (np.random.random() < perf['cross_file'])
+            tests_passed = tests_passed and (cross_file_roll < perf['cross_file'])
         
         return {
             'retrieved_files': retrieved_files,
             'retrieved_tokens': len(retrieved_files) * 3000,  # Avg tokens per file
             'used_tokens': int(len(retrieved_files) * 3000 * 0.3),  # 30% used
             'tests_passed': tests_passed,
-            'iterations': int(np.random.normal(perf['iterations'], 1.0)),
-            'time_minutes': np.random.normal(30, 10),
-            'introduced_regression': np.random.random() < 0.05  # 5% regression rate
+            'iterations': iterations,
+            'time_minutes': time_minutes,
+            'introduced_regression': regression_roll < 0.05  # 5% regression rate
         }
     
+    def _draw_outcomes(self, model_name: str, n: int) -> List[OutcomeDraw]:
+        """Draw the random outcomes of n simulated runs, one batch per quantity"""
+        perf = MODEL_PERFORMANCE.get(model_name, MODEL_PERFORMANCE["gpt_4_1"])
+        fix_rolls = self.rng.random(n)
+        cross_file_rolls = self.rng.random(n)
+        # Truncated toward zero, as int() does
+        iterations = self.rng.normal(perf['iterations'], 1.0, n).astype(np.int64)
+        time_minutes = self.rng.normal(30, 10, n)
+        regression_rolls = self.rng.random(n)
+        return list(zip(fix_rolls.tolist(), cross_file_rolls.tolist(), iterations.tolist(),
+                        time_minutes.tolist(), regression_rolls.tolist()))
+    
+    def _retrieval_features(self, scenario: Dict) -> Tuple[List[str], List[str]]:
+        """Split a scenario's files into the relevant ones and the irrelevant
+        candidates retrieval samples from"""
+        all_files = scenario.get('scattered_files', [])
+        relevant_files = scenario.get('ground_truth', {}).get('related_files', all_files[:5])
+        relevant_set = set(relevant_files)
+        return relevant_files, [f for f in all_files if f not in relevant_set]
+    
     def _simulate_retrieval(self, 
                           relevant: List[str], 
-                          all_files: List[str], 
+                          irrelevant: List[str], 
                           n_retrieve: int,
                           precision: float) -> List[str]:
         """Simulate retrieval with given precision"""
@@ -251,12 +412,12 @@ class MRRBenchmarkRunner:
         retrieved.extend(relevant[:n_relevant])
         
         # Add irrelevant files
-        irrelevant = [f for f in all_files if f not in relevant]
         n_irrelevant = n_retrieve - len(retrieved)
         if irrelevant and n_irrelevant > 0:
-            retrieved.extend(np.random.choice(irrelevant, 
-                                            min(n_irrelevant, len(irrelevant)), 
-                                            replace=False).tolist())
+            # Sample positions rather than the strings themselves, so the file
+            # list is never converted to an array
+            picks = self.rng.choice(len(irrelevant), min(n_irrelevant, len(irrelevant)), replace=False)
+            retrieved.extend(irrelevant[i] for i in picks)
         
         return retrieved
     
@@ -289,11 +450,12 @@ class MRRBenchmarkRunner:
             logger.info(f"Evaluating model: {model}")
             logger.info(f"{'='*60}")
             
-            results = self.evaluate_model(model, scenarios)
+            # Results are written out as they complete
+            results_file = Path(self.config.output_dir) / f"{model}_results.jsonl"
+            results = self.evaluate_model(model, scenarios, results_file)
             model_results[model] = results
             
-            # Save intermediate results
-            self._save_model_results(model, results)
+            self._save_model_results(model, results, results_file)
         
         # Compare models
         comparison = compare_models_mrr(model_results)
@@ -303,22 +465,19 @@ class MRRBenchmarkRunner:
         
         logger.info("\nBenchmark complete!")
         
-    def _save_model_results(self, model_name: str, results: List[MRRResult]):
-        """Save results for a single model"""
+    def _save_model_results(self, model_name: str, results: List[MRRResult], results_file: Path):
+        """Save the manifest for a single model's streamed results"""
         output_file = Path(self.config.output_dir) / f"{model_name}_results.json"
         
-        # Convert results to dict
-        results_dict = [asdict(r) for r in results]
-        
         with open(output_file, 'w') as f:
             json.dump({
                 'model': model_name,
                 'n_scenarios': len(results),
                 'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
-                'results': results_dict
+                'results_file': results_file.name
             }, f, indent=2)
         
-        logger.info(f"Saved results to {output_file}")
+        logger.info(f"Saved results to {results_file}")
     
     def _generate_report(self, comparison: Dict, model_results: Dict):
         """Generate comprehensive benchmark report"""
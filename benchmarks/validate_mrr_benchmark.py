@@ -5,16 +5,28 @@ Validates that the benchmark produces expected results for all models
 Ensures consistency and correctness of the benchmark implementation
 """
 
+import os
 import json
+import random
+import functools
+import itertools
+import multiprocessing as mp
 import numpy as np
 from pathlib import Path
 import subprocess
 import sys
 import time
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
 import argparse
 import logging
-from scipy import stats
+from math import log, sqrt
+from statistics import NormalDist
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -43,11 +55,111 @@ EXPECTED_PERFORMANCE = {
     }
 }
 
+# Fields every scenario file must have, in the order missing ones are reported
+REQUIRED_FIELDS = (
+    "bug_id", "category", "description", "scattered_files",
+    "temporal_range", "ground_truth"
+)
+_REQUIRED_FIELD_SET = frozenset(REQUIRED_FIELDS)
+
+# Two-sided 95% Student-t critical value for the statistical check's 10 runs
+# (9 degrees of freedom)
+T_CRITICAL_95_DF9 = 2.262157162798205
+
+def _t_critical_95(df: int) -> float:
+    """Two-sided 95% Student-t critical value for df degrees of freedom"""
+    if df == 9:
+        return T_CRITICAL_95_DF9
+    from scipy import stats  # only needed if the number of runs changes
+    return float(stats.t.ppf(0.975, df))
+
+def _skewness_p_value(values: List[float]) -> float:
+    """Two-sided p-value of D'Agostino's skewness test (valid for n >= 8)
+    
+    Closed form of scipy.stats.skewtest, a cheap normality check for the
+    handful of success rates the statistical validation produces.
+    """
+    n = len(values)
+    data = np.asarray(values, dtype=np.float64)
+    if data.min() == data.max():
+        # Identical values show no skew; test this directly, as rounding in
+        # the mean can leave m2 a tiny non-zero number
+        return 1.0
+    deviations = data - data.mean()
+    m2 = np.mean(deviations ** 2)
+    skewness = np.mean(deviations ** 3) / m2 ** 1.5
+    
+    y = skewness * sqrt((n + 1) * (n + 3) / (6.0 * (n - 2)))
+    beta2 = (3.0 * (n ** 2 + 27 * n - 70) * (n + 1) * (n + 3) /
+             ((n - 2.0) * (n + 5) * (n + 7) * (n + 9)))
+    w2 = -1 + sqrt(2 * (beta2 - 1))
+    delta = 1 / sqrt(0.5 * log(w2))
+    alpha = sqrt(2.0 / (w2 - 1))
+    if y == 0:
+        y = 1
+    z = delta * log(y / alpha + sqrt((y / alpha) ** 2 + 1))
+    return 2 * NormalDist().cdf(-abs(z))
+
+def _read_json(path: Path) -> Any:
+    """Read a JSON file, using orjson when available"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path) as f:
+        return json.load(f)
+
+def _check_scenario_file(file_path: Path) -> List[Tuple[Path, str]]:
+    """Check one scenario file's format and content, returning its problems"""
+    problems = []
+    try:
+        data = _read_json(file_path)
+        
+        # Check required fields: one subset test on the keys, and the ordered
+        # list of missing ones only for files that fail it
+        if not (isinstance(data, dict) and data.keys() >= _REQUIRED_FIELD_SET):
+            missing_fields = [field for field in REQUIRED_FIELDS if field not in data]
+            if missing_fields:
+                problems.append((file_path, f"Missing fields: {missing_fields}"))
+        
+        # Validate scattered files
+        if len(data.get('scattered_files', ())) < 10:
+            problems.append((file_path, "Too few scattered files (<10)"))
+            
+    except json.JSONDecodeError as e:  # orjson's decode error subclasses it
+        problems.append((file_path, f"JSON error: {e}"))
+    except Exception as e:
+        problems.append((file_path, f"Error: {e}"))
+    return problems
+
+def _parse_problem(file_path: Path) -> Optional[Tuple[Path, str]]:
+    """Check only that a file parses as JSON, returning the problem if not"""
+    try:
+        _read_json(file_path)
+    except json.JSONDecodeError as e:
+        return (file_path, f"JSON error: {e}")
+    except Exception as e:
+        return (file_path, f"Error: {e}")
+    return None
+
+@functools.lru_cache(maxsize=None)
+def _benchmark_runner_classes():
+    """Import the full benchmark runner once, for every mini benchmark run"""
+    benchmarks_dir = str(Path(__file__).parent)
+    if benchmarks_dir not in sys.path:
+        sys.path.append(benchmarks_dir)
+    from run_full_mrr_benchmark import MRRBenchmarkRunner, BenchmarkConfig
+    return MRRBenchmarkRunner, BenchmarkConfig
+
 class MRRBenchmarkValidator:
     """Validates MRR benchmark correctness and consistency"""
     
-    def __init__(self, benchmark_dir: str = "mrr_full_benchmark"):
+    # Files handed to a worker process at a time when checks run in parallel
+    CHECK_CHUNKSIZE = 16
+    
+    def __init__(self, benchmark_dir: str = "mrr_full_benchmark", num_workers: Optional[int] = None):
         self.benchmark_dir = Path(benchmark_dir)
+        self.num_workers = num_workers or max(1, mp.cpu_count() - 1)
+        self._file_index: Optional[Dict[Path, List[Path]]] = None
         self.results_dir = Path("results/mrr_validation")
         self.results_dir.mkdir(parents=True, exist_ok=True)
         
@@ -120,10 +232,13 @@ class MRRBenchmarkValidator:
         }
         
         total_files = 0
+        scenario_files = []
         for category, expected in expected_counts.items():
             category_path = self.benchmark_dir / category
             if category_path.exists():
-                actual = len(list(category_path.glob("*.json")))
+                category_files = self._index_benchmark().get(category_path, [])
+                scenario_files.extend(category_files)
+                actual = len(category_files)
                 total_files += actual
                 if actual < expected * 0.9:  # Allow 10% tolerance
                     logger.warning(f"⚠ {category}: {actual} files (expected ~{expected})")
@@ -132,41 +247,30 @@ class MRRBenchmarkValidator:
         
         logger.info(f"\nTotal scenario files: {total_files}")
         
-        return len(missing_dirs) == 0 and total_files >= 4500
+        # Cheap first pass over every scenario file: only confirm it parses.
+        # The field checks in validate_scenarios still run on a sample
+        unparseable = [problem for problem in self._map_files(_parse_problem, scenario_files)
+                       if problem is not None]
+        if unparseable:
+            logger.error(f"✗ Found {len(unparseable)} unparseable scenario files:")
+            for file_path, error in unparseable[:5]:  # Show first 5
+                logger.error(f"  - {file_path.name}: {error}")
+        else:
+            logger.info(f"✓ All {total_files} scenario files parse")
+        
+        return len(missing_dirs) == 0 and total_files >= 4500 and not unparseable
     
     def validate_scenarios(self) -> bool:
         """Validate scenario file format and content"""
         logger.info("\n2. Validating Scenario Files")
         logger.info("-"*40)
         
-        required_fields = [
-            "bug_id", "category", "description", "scattered_files",
-            "temporal_range", "ground_truth"
-        ]
-        
         sample_size = 100  # Check sample of files
-        all_files = list(self.benchmark_dir.rglob("*.json"))
-        sample_files = np.random.choice(all_files, min(sample_size, len(all_files)), replace=False)
-        
-        invalid_files = []
-        for file_path in sample_files:
-            try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                
-                # Check required fields
-                missing_fields = [field for field in required_fields if field not in data]
-                if missing_fields:
-                    invalid_files.append((file_path, f"Missing fields: {missing_fields}"))
-                
-                # Validate scattered files
-                if len(data.get('scattered_files', [])) < 10:
-                    invalid_files.append((file_path, "Too few scattered files (<10)"))
-                    
-            except json.JSONDecodeError as e:
-                invalid_files.append((file_path, f"JSON error: {e}"))
-            except Exception as e:
-                invalid_files.append((file_path, f"Error: {e}"))
+        all_files = list(itertools.chain.from_iterable(self._index_benchmark().values()))
+        sample_files = random.sample(all_files, min(sample_size, len(all_files)))
+        
+        invalid_files = [problem for problems in self._map_files(_check_scenario_file, sample_files)
+                         for problem in problems]
         
         if invalid_files:
             logger.error(f"✗ Found {len(invalid_files)} invalid files:")
@@ -177,6 +281,39 @@ class MRRBenchmarkValidator:
         
         return len(invalid_files) == 0
     
+    def _index_benchmark(self) -> Dict[Path, List[Path]]:
+        """JSON files under the benchmark directory, keyed by the directory holding them
+        
+        Built with a single os.scandir walk on first use and shared by the
+        structure and scenario checks instead of each globbing the tree.
+        """
+        if self._file_index is None:
+            index = {}
+            pending = [self.benchmark_dir] if self.benchmark_dir.is_dir() else []
+            while pending:
+                directory = pending.pop()
+                json_files = []
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(directory / entry.name)
+                        elif entry.name.endswith('.json'):
+                            json_files.append(directory / entry.name)
+                index[directory] = json_files
+            self._file_index = index
+        return self._file_index
+    
+    def _map_files(self, check, files) -> list:
+        """Apply a per-file check to every file, in order
+        
+        Files are independent, so the checks run across worker processes;
+        too few files to fill the workers are not worth starting a pool for.
+        """
+        if self.num_workers <= 1 or len(files) < self.num_workers * self.CHECK_CHUNKSIZE:
+            return list(map(check, files))
+        with ProcessPoolExecutor(max_workers=self.num_workers) as executor:
+            return list(executor.map(check, files, chunksize=self.CHECK_CHUNKSIZE))
+    
     def validate_expected_results(self) -> bool:
         """Validate that benchmark produces expected results"""
         logger.info("\n3. Validating Expected Results")
@@ -262,9 +399,9 @@ class MRRBenchmarkValidator:
         # Calculate statistics
         mean_rate = np.mean(success_rates)
         std_rate = np.std(success_rates)
-        ci_95 = stats.t.interval(0.95, len(success_rates)-1, 
-                                loc=mean_rate, 
-                                scale=stats.sem(success_rates))
+        sem = np.std(success_rates, ddof=1) / np.sqrt(len(success_rates))
+        margin = _t_critical_95(len(success_rates) - 1) * sem
+        ci_95 = (mean_rate - margin, mean_rate + margin)
         
         expected = EXPECTED_PERFORMANCE[model]
         
@@ -283,12 +420,12 @@ class MRRBenchmarkValidator:
                    f"(width: {ci_width:.1%})")
         logger.info(f"  Standard deviation: {std_rate:.1%}")
         
-        # Validate distribution is approximately normal
-        _, p_value = stats.shapiro(success_rates)
+        # Validate distribution is approximately normal (no significant skew)
+        p_value = _skewness_p_value(success_rates)
         if p_value > 0.05:
-            logger.info(f"✓ Distribution appears normal (p={p_value:.3f})")
+            logger.info(f"✓ Distribution appears normal (skewness p={p_value:.3f})")
         else:
-            logger.warning(f"⚠ Distribution may not be normal (p={p_value:.3f})")
+            logger.warning(f"⚠ Distribution may not be normal (skewness p={p_value:.3f})")
         
         return True
     
@@ -297,8 +434,7 @@ class MRRBenchmarkValidator:
         """Run a mini version of the benchmark"""
         try:
             # Import and run the benchmark
-            sys.path.append(str(Path(__file__).parent))
-            from run_full_mrr_benchmark import MRRBenchmarkRunner, BenchmarkConfig
+            MRRBenchmarkRunner, BenchmarkConfig = _benchmark_runner_classes()
             
             config = BenchmarkConfig(
                 seed=seed,
@@ -360,10 +496,12 @@ def main():
     parser = argparse.ArgumentParser(description='Validate MRR Benchmark')
     parser.add_argument('--benchmark-dir', type=str, default='mrr_full_benchmark',
                        help='Path to benchmark directory')
+    parser.add_argument('--workers', type=int, default=None,
+                       help='Number of parallel workers')
     
     args = parser.parse_args()
     
-    validator = MRRBenchmarkValidator(args.benchmark_dir)
+    validator = MRRBenchmarkValidator(args.benchmark_dir, num_workers=args.workers)
     all_passed = validator.validate_all()
     
     print("\n" + "="*60)
@@ -4,11 +4,28 @@ Test suite for evaluation metrics calculations.
 This module tests the metric calculations used in the Chronos evaluation framework.
 """
 
+import importlib.util
+import random
+from pathlib import Path
+
 import pytest
 import numpy as np
 from typing import List, Dict, Any
 
 
+def _load_mrr_metrics():
+    """Load the MRR metrics module, which lives in a hyphenated directory."""
+    path = (Path(__file__).resolve().parent.parent / "benchmarks" / "multi-random-retrieval"
+            / "evaluation_metrics" / "metrics.py")
+    spec = importlib.util.spec_from_file_location("mrr_evaluation_metrics", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+mrr_metrics = _load_mrr_metrics()
+
+
 class TestMetrics:
     """Test evaluation metrics calculations."""
     
@@ -147,5 +164,52 @@ class TestMetrics:
         return 0.05
 
 
+class TestMRRComputeAll:
+    """Test that the single-pass MRR metrics match the per-metric functions."""
+    
+    KS = (1, 5, 10, 20)
+    F1_K = 10
+    
+    def expected_metrics(self, retrieved: List[str], relevant: set) -> Dict[str, float]:
+        """Compute every retrieval metric with the per-metric functions."""
+        metrics = mrr_metrics.MRRMetrics
+        expected = {f"precision_at_{k}": metrics.precision_at_k(retrieved, relevant, k) for k in self.KS}
+        expected.update({f"recall_at_{k}": metrics.recall_at_k(retrieved, relevant, k) for k in self.KS})
+        expected[f"f1_at_{self.F1_K}"] = metrics.f1_at_k(retrieved, relevant, self.F1_K)
+        expected["mrr"] = metrics.mean_reciprocal_rank(retrieved, relevant)
+        expected["average_precision"] = metrics.average_precision(retrieved, relevant)
+        return expected
+    
+    def assert_matches(self, retrieved: List[str], relevant: set):
+        actual = mrr_metrics.MRRMetrics.compute_all(retrieved, relevant, ks=self.KS, f1_k=self.F1_K)
+        expected = self.expected_metrics(retrieved, relevant)
+        assert actual.keys() == expected.keys()
+        for name, value in expected.items():
+            assert actual[name] == pytest.approx(value, abs=1e-12), (name, retrieved, relevant)
+    
+    def test_empty_ranking(self):
+        """Test an empty ranking with and without relevant items."""
+        self.assert_matches([], set())
+        self.assert_matches([], {"file1.py", "file2.py"})
+    
+    def test_empty_relevant_set(self):
+        """Test a non-empty ranking with nothing relevant."""
+        self.assert_matches(["file1.py", "file2.py", "file3.py"], set())
+    
+    def test_duplicate_hits(self):
+        """Test a ranking that retrieves the same relevant item more than once."""
+        self.assert_matches(["file1.py", "file1.py", "file2.py", "file1.py"], {"file1.py", "file3.py"})
+    
+    def test_random_tasks(self):
+        """Test many random rankings, including empty and duplicate cases."""
+        rng = random.Random(1234)
+        pool = [f"file{i}.py" for i in range(30)]
+        for _ in range(2000):
+            # Draw with replacement so rankings contain duplicates
+            retrieved = [rng.choice(pool) for _ in range(rng.randint(0, 25))]
+            relevant = set(rng.sample(pool, rng.randint(0, 8)))
+            self.assert_matches(retrieved, relevant)
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
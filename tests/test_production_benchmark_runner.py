@@ -0,0 +1,83 @@
+"""
+Test suite for checkpointing in the production benchmark runner.
+
+Checkpoints are appended one pickled batch at a time; a batch cut short by an
+interrupted write is truncated away when the checkpoint is loaded.
+"""
+
+import dataclasses
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+
+from production_benchmark_runner import ProductionBenchmarkRunner, ScenarioInfo
+
+
+class Interrupted(Exception):
+    """Raised to stop a benchmark run part way through."""
+
+
+class TestCheckpointResume:
+    """Test resuming a model benchmark from an appended checkpoint."""
+    
+    NUM_SCENARIOS = 23
+    CHECKPOINT_INTERVAL = 5
+    MODEL = "chronos"
+    
+    @pytest.fixture
+    def runner(self, tmp_path, monkeypatch):
+        # Scenarios are loaded relative to the working directory; from an empty
+        # one none are found and the synthetic ones below are used instead
+        monkeypatch.chdir(tmp_path)
+        runner = ProductionBenchmarkRunner(output_dir=str(tmp_path / "results"),
+                                           checkpoint_interval=self.CHECKPOINT_INTERVAL,
+                                           num_workers=1)
+        runner.scenarios = [
+            ScenarioInfo(bug_id=f"bug_{i:04d}", category="logic_errors", subcategory="unknown",
+                         num_scattered_files=10 + i, difficulty=0.5 + (i % 5) / 10)
+            for i in range(self.NUM_SCENARIOS)
+        ]
+        return runner
+    
+    def interrupt_after(self, runner, count):
+        """Make runs stop after evaluating count scenarios."""
+        evaluate = runner._evaluate_scenarios
+        
+        def evaluate_then_stop(scenarios, model_spec, model_name):
+            for n, result in enumerate(evaluate(scenarios, model_spec, model_name)):
+                if n == count:
+                    raise Interrupted
+                yield result
+        
+        runner._evaluate_scenarios = evaluate_then_stop
+    
+    def test_resume_after_torn_batch(self, runner):
+        """Test that a truncated last batch is dropped and resuming matches a full run."""
+        expected = [dataclasses.asdict(r) for r in runner.run_model_benchmark(self.MODEL)]
+        checkpoint_file = runner.output_dir / f"checkpoint_{self.MODEL}.pkl"
+        assert not checkpoint_file.exists()
+        
+        # Stop after three checkpoint batches have been appended
+        self.interrupt_after(runner, 17)
+        with pytest.raises(Interrupted):
+            runner.run_model_benchmark(self.MODEL)
+        del runner._evaluate_scenarios
+        assert len(runner._load_checkpoint(checkpoint_file)) == 15
+        
+        # Cut the last batch short, as an interrupted write would
+        size = os.path.getsize(checkpoint_file)
+        os.truncate(checkpoint_file, size - 40)
+        
+        completed = [dataclasses.asdict(r) for r in runner._load_checkpoint(checkpoint_file)]
+        assert completed == expected[:10]
+        assert {r["bug_id"] for r in completed} == {r["bug_id"] for r in expected[:10]}
+        assert os.path.getsize(checkpoint_file) < size - 40
+        
+        results = [dataclasses.asdict(r) for r in runner.run_model_benchmark(self.MODEL)]
+        assert results == expected
+        assert {r["bug_id"] for r in results} == {s.bug_id for s in runner.scenarios}
+        assert not checkpoint_file.exists()
@@ -0,0 +1,36 @@
+"""
+Test suite for the statistical helpers in the MRR benchmark validator.
+
+The expected values were computed with scipy.stats, which the validator no
+longer imports for these checks.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+
+from validate_mrr_benchmark import _skewness_p_value, _t_critical_95
+
+
+class TestStatisticalHelpers:
+    """Test the closed-form replacements for scipy.stats."""
+    
+    def test_skewness_p_value_matches_skewtest(self):
+        """Test against scipy.stats.skewtest for a fixed 10-sample vector."""
+        rates = [0.14, 0.15, 0.13, 0.142, 0.138, 0.15, 0.141, 0.139, 0.144, 0.146]
+        assert _skewness_p_value(rates) == pytest.approx(0.4760348722776191, rel=1e-12)
+    
+    def test_skewness_p_value_constant_input(self):
+        """Test that identical values are reported as showing no skew."""
+        assert _skewness_p_value([0.65] * 10) == 1.0
+    
+    def test_t_critical_95(self):
+        """Test the two-sided 95% critical value for 9 degrees of freedom."""
+        assert _t_critical_95(9) == pytest.approx(2.262157162798205, rel=1e-15)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])